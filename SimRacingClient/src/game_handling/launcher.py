@@ -7,22 +7,31 @@ This module provides the launch() function that:
 3. Waits for and focuses the game window
 4. Executes role-based template navigation
 """
-# Add src directory to path for direct script execution
 import sys
 from pathlib import Path
-src_dir = Path(__file__).parent.parent
-if str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
-
 from typing import get_args, Dict, Optional
+import json
+import os
+import subprocess
+import tempfile
 import threading
 from utils.focus_window import _wait_and_focus_window
 from utils.monitoring import get_logger
+from utils.process import launch_process, launch_process_elevated, is_process_running, is_running_elevated
+from utils.screen_navigator import load_and_execute_navigation, prewarm_navigation_templates
 from utils.data_model import Role, PreLaunchConfig
-from game_handling.registry import GAME_REGISTRY
+from .registry import GAME_REGISTRY
 
 logger = get_logger(__name__)
 
+# Resolved once at import; launch() and the pre-launch step only need the strings
+_SRC_DIR = Path(__file__).resolve().parent.parent
+_TEMPLATE_BASE_DIR = str(_SRC_DIR.parent / "templates")
+_CLICK_WORKER_SCRIPT = str(_SRC_DIR / "utils" / "elevated_click_worker.py")
+
+# Allowed role values, taken from the Role literal once
+_VALID_ROLES = get_args(Role)
+
 
 def execute_pre_launch_config(config: PreLaunchConfig, template_base_dir: str) -> bool:
     """
@@ -42,13 +51,6 @@ def execute_pre_launch_config(config: PreLaunchConfig, template_base_dir: str) -
     Returns:
         True if pre-launch config completed successfully, False otherwise
     """
-    from utils.process import launch_process_elevated, is_process_running, is_running_elevated
-    import subprocess
-    import tempfile
-    import json
-    import os
-    import time
-
     # --- Launch software if not already running (elevated) ---
     if config.executable_path and config.process_name:
         if not is_process_running(config.process_name):
@@ -56,15 +58,14 @@ def execute_pre_launch_config(config: PreLaunchConfig, template_base_dir: str) -
             if not launch_process_elevated(Path(config.executable_path)):
                 logger.error(f"Failed to launch {config.executable_path} – user may have denied UAC")
                 return False
-            time.sleep(3)
 
             if config.window_title:
-                if not _wait_and_focus_window(config.window_title, max_attempts=10):
+                if not _wait_and_focus_window(config.window_title, timeout=20):
                     logger.warning(f"Could not focus {config.window_title} window, continuing anyway...")
         else:
             logger.info(f"{config.process_name} is already running")
             if config.window_title:
-                _wait_and_focus_window(config.window_title, max_attempts=5)
+                _wait_and_focus_window(config.window_title, timeout=10)
 
     # --- Execute click sequence via elevated worker ---
     if not config.click_steps:
@@ -72,7 +73,7 @@ def execute_pre_launch_config(config: PreLaunchConfig, template_base_dir: str) -
         return True
 
     template_dir = str(Path(template_base_dir) / config.template_dir)
-    worker_script = str(Path(__file__).resolve().parent.parent / "utils" / "elevated_click_worker.py")
+    worker_script = _CLICK_WORKER_SCRIPT
 
     worker_config = {
         "template_dir": template_dir,
@@ -139,64 +140,67 @@ def launch(game_id: str, role: Role, cancel_event: Optional[threading.Event] = N
     Raises:
         ValueError: If game_id is unknown or role is invalid
     """
-    # Import here to avoid circular imports
-    from utils.process import launch_process
-    from utils.screen_navigator import load_and_execute_navigation
-
     # Validate role
-    valid_roles = get_args(Role)
-    if role not in valid_roles:
-        raise ValueError(f"Invalid role: '{role}'. Must be one of {valid_roles}")
+    if role not in _VALID_ROLES:
+        raise ValueError(f"Invalid role: '{role}'. Must be one of {_VALID_ROLES}")
 
     # Get game configuration
     config = GAME_REGISTRY.get(game_id)
-    logger.info(f"Launching {config.name} as role: '{role}'")
+    logger.info("Launching %s as role: '%s'", config.name, role)
 
-    # Determine template base directory (from project root)
-    project_root = Path(__file__).parent.parent.parent
-    template_base_dir = project_root / "templates"
+    template_base_dir = _TEMPLATE_BASE_DIR
 
     # Execute pre-launch configuration if enabled
     if config.pre_launch_config and config.pre_launch_config.enabled:
-        logger.info(f"Pre-launch configuration is enabled for {config.name}")
-        if not execute_pre_launch_config(config.pre_launch_config, str(template_base_dir)):
+        logger.info("Pre-launch configuration is enabled for %s", config.name)
+        if not execute_pre_launch_config(config.pre_launch_config, template_base_dir):
             logger.error("Pre-launch configuration failed, aborting game launch")
             return False
         logger.info("Pre-launch configuration completed, proceeding with game launch")
     else:
         logger.info("No pre-launch configuration needed")
 
+    logger.info("Loading navigation configs for role: '%s' (player_count=%s)", role, player_count)
+    nav_configs = config.get_navigation_configs(role, player_count=player_count)
+    logger.info("  Found %s navigation config(s)", len(nav_configs))
+
     # Launch the executable
     process = launch_process(config.executable_path)
-    logger.info(f"Process started (PID: {process.pid})")
+    logger.info("Process started (PID: %s)", process.pid)
+
+    # Decode the navigation templates while the game window is still starting
+    threading.Thread(
+        target=prewarm_navigation_templates,
+        args=(nav_configs, template_base_dir),
+        daemon=True
+    ).start()
 
     # Wait for window to appear and focus it
-    if not _wait_and_focus_window(config.window_title, max_attempts=10):
+    if not _wait_and_focus_window(config.window_title, timeout=20, cancel_event=cancel_event):
+        if cancel_event and cancel_event.is_set():
+            logger.info("Launch cancelled while waiting for game window")
+            return False
         logger.warning(f"Could not focus {config.name} window, continuing anyway...")
 
-    logger.info(f"Loading navigation configs for role: '{role}' (player_count={player_count})")
-    nav_configs = config.get_navigation_configs(role, player_count=player_count)
-    logger.info(f"  Found {len(nav_configs)} navigation config(s)")
-
     # Execute all navigation configs in sequence
     # If any config fails, abort the entire launch
-    logger.info(f"Executing {len(nav_configs)} navigation config(s) for role '{role}'")
+    logger.info("Executing %s navigation config(s) for role '%s'", len(nav_configs), role)
 
     for config_index, nav_config in enumerate(nav_configs, 1):
         # Check for cancellation before starting each config
         if cancel_event and cancel_event.is_set():
-            logger.info(f"Navigation cancelled before config {config_index}")
+            logger.info("Navigation cancelled before config %s", config_index)
             return False
 
-        logger.info(f"Executing config {config_index}/{len(nav_configs)}")
-        logger.info(f"  Template dir: {nav_config.template_dir}")
-        logger.info(f"  Threshold: {nav_config.template_threshold}, Max retries: {nav_config.max_retries}")
-        logger.info(f"  Steps: {len(nav_config.navigation_sequence.steps)}")
-        logger.info(f"  Host ip: {host_ip}")
+        logger.info("Executing config %s/%s", config_index, len(nav_configs))
+        logger.info("  Template dir: %s", nav_config.template_dir)
+        logger.info("  Threshold: %s, Max retries: %s", nav_config.template_threshold, nav_config.max_retries)
+        logger.info("  Steps: %s", len(nav_config.navigation_sequence.steps))
+        logger.info("  Host ip: %s", host_ip)
 
         success = load_and_execute_navigation(
             nav_config=nav_config,
-            template_base_dir=str(template_base_dir),
+            template_base_dir=template_base_dir,
             cancel_event=cancel_event,
             context={"host_ip": host_ip} if host_ip else None
         )
@@ -204,19 +208,20 @@ def launch(game_id: str, role: Role, cancel_event: Optional[threading.Event] = N
         if not success:
             # Check if failure was due to cancellation
             if cancel_event and cancel_event.is_set():
-                logger.info(f"Navigation cancelled during config {config_index}")
+                logger.info("Navigation cancelled during config %s", config_index)
             else:
                 logger.error(f"[FAILED] Config {config_index}/{len(nav_configs)} failed")
             return False
 
-        logger.info(f"[OK] Config {config_index}/{len(nav_configs)} completed")
+        logger.info("[OK] Config %s/%s completed", config_index, len(nav_configs))
 
     # All configs completed successfully
     
-    logger.info(f"[SUCCESS] Launched {config.name} as role '{role}' (all {len(nav_configs)} config(s) completed)")
+    logger.info("[SUCCESS] Launched %s as role '%s' (all %s config(s) completed)", config.name, role, len(nav_configs))
     return True
 
 
 
 if __name__ == "__main__":
+    # Run from the src directory: python -m game_handling.launcher
     launch("f1_22", "singleplayer")
@@ -8,12 +8,15 @@ The GameRegistry provides a centralized way to:
 - Terminate running games
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List
-import json
+import os
+import threading
+import orjson
 from pydantic import ValidationError
 from utils.monitoring import get_logger
-from utils.data_model import Role, GameConfig, NavigationConfig, NavigationSequence, Step
+from utils.data_model import Role, GameConfig, NavigationConfig, load_navigation_sequence
 
 logger = get_logger(__name__)
 
@@ -21,24 +24,42 @@ class GameRegistry:
     """Registry of all configured games."""
 
     def __init__(self, config_path: Path):
+        self._config_path = config_path
         self._games: Dict[str, GameConfig] = {}
-        self._load_config(config_path)
+        self._loaded = False
+        self._load_lock = threading.Lock()
+
+    def _ensure_loaded(self):
+        """Load game configurations on first use instead of at import time."""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:
+                self._load_config(self._config_path)
+                self._loaded = True
 
     def _load_config(self, config_path: Path):
         """Load game configurations from JSON file."""
         if not config_path.exists():
             logger.error(f"Game configuration file not found: {config_path}")
             return
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
+        config_data = orjson.loads(config_path.read_bytes())
         project_root = config_path.parent
         template_base = project_root / "templates"
+        # Plain strings for the per-config path joins; Path objects are only
+        # built once per game for the models that need them
+        project_root_str = str(project_root)
+        template_base_str = str(template_base)
+
+        # Parse all sequence files concurrently first; the loop below then takes
+        # them from the sequence cache and reports any errors as before
+        self._preload_sequences(config_data, template_base_str)
 
         for game_id, game_data in config_data.items():
             try:
-                exe_path = Path(game_data['executable_path'])
-                if not exe_path.is_absolute():
-                    exe_path = project_root / exe_path
+                exe_str = game_data['executable_path']
+                if not os.path.isabs(exe_str):
+                    exe_str = os.path.join(project_root_str, exe_str)
 
                 # Parse navigation configs (dict mapping role to array of config objects)
                 nav_configs_dict = game_data.get('navigation_config', {})
@@ -68,7 +89,7 @@ class GameRegistry:
 
                             # Check if path contains {n} placeholder - defer loading
                             if "{n}" in nav_seq_file:
-                                logger.debug(f"  Deferred loading for dynamic path: {nav_seq_file}")
+                                logger.debug("  Deferred loading for dynamic path: %s", nav_seq_file)
                                 nav_config = NavigationConfig(
                                     template_dir=template_dir,
                                     template_threshold=template_threshold,
@@ -80,20 +101,17 @@ class GameRegistry:
                                 )
                                 nav_config._template_base = template_base  # Store for later resolution
                                 role_configs.append(nav_config)
-                                logger.debug(f"  Registered deferred config {config_index+1} for role '{role}' (path: {nav_seq_file})")
+                                logger.debug("  Registered deferred config %s for role '%s' (path: %s)", config_index+1, role, nav_seq_file)
                                 continue
 
                             # Resolve navigation sequence file path (relative to template_base)
-                            nav_seq_path = template_base / nav_seq_file
+                            nav_seq_path = os.path.join(template_base_str, nav_seq_file)
 
                             # Load and parse the navigation sequence JSON file
-                            if not nav_seq_path.exists():
+                            if not os.path.exists(nav_seq_path):
                                 logger.error(f"Navigation sequence file not found: {nav_seq_path}")
                                 raise FileNotFoundError
-                            with open(nav_seq_path, 'r') as f:
-                                steps_data = json.load(f)
-                            steps = [Step(**step_data) for step_data in steps_data]
-                            nav_sequence = NavigationSequence(steps=steps)
+                            nav_sequence = load_navigation_sequence(nav_seq_path)
 
                             # Create NavigationConfig with parameters + sequence
                             nav_config = NavigationConfig(
@@ -107,20 +125,13 @@ class GameRegistry:
                             )
 
                             role_configs.append(nav_config)
-                            logger.debug(f"  Loaded config {config_index+1} for role '{role}' from {nav_seq_path.name} ({len(steps)} steps)")
+                            logger.debug("  Loaded config %s for role '%s' from %s (%s steps)", config_index+1, role, os.path.basename(nav_seq_path), len(nav_sequence.steps))
 
                         except KeyError as e:
                             logger.error(f"Missing required field in config {config_index+1} for role '{role}' in game '{game_id}': {e}")
                             continue
-                        except json.JSONDecodeError as e:
-                            # nav_seq_path is guaranteed to be defined (file was opened on line 76)
-                            if nav_seq_path:
-                                logger.error(f"Invalid JSON in navigation sequence file {nav_seq_path}: {e}")
-                            else:
-                                logger.error(f"Invalid JSON in navigation sequence for config {config_index+1}, role '{role}': {e}")
-                            continue
                         except ValidationError as e:
-                            # nav_seq_path is guaranteed to be defined (JSON was loaded on line 77)
+                            # Covers both malformed JSON and schema errors (validate_json does both)
                             if nav_seq_path:
                                 logger.error(f"Navigation sequence validation failed for {nav_seq_path}: {e}")
                             else:
@@ -133,27 +144,54 @@ class GameRegistry:
 
                     if role_configs:
                         navigations[role] = role_configs
-                        logger.debug(f"  Loaded {len(role_configs)} config(s) for role '{role}'")
+                        logger.debug("  Loaded %s config(s) for role '%s'", len(role_configs), role)
 
                 # Create GameConfig
                 game_config = GameConfig(
                     game_id=game_id,
                     name=game_data['name'],
-                    executable_path=exe_path,
+                    executable_path=Path(exe_str),
                     process_name=game_data['process_name'],
                     window_title=game_data['window_title'],
                     navigations=navigations
                 )
 
                 self._games[game_id] = game_config
-                logger.debug(f"Registered game: {game_id} ({game_config.name}) with {len(navigations)} navigation(s)")
+                logger.debug("Registered game: %s (%s) with %s navigation(s)", game_id, game_config.name, len(navigations))
 
             except KeyError as e:
                 logger.error(f"Missing required field in config for game '{game_id}': {e}")
             except Exception as e:
                 logger.error(f"Error loading config for game '{game_id}': {e}")
 
-        logger.info(f"Loaded {len(self._games)} game(s): {list(self._games.keys())}")
+        logger.info("Loaded %s game(s): %s", len(self._games), list(self._games.keys()))
+
+    @staticmethod
+    def _preload_sequences(config_data: dict, template_base_str: str, max_workers: int = 8):
+        """Load every static navigation sequence file in parallel to warm the sequence cache."""
+        paths = set()
+        for game_data in config_data.values():
+            if not isinstance(game_data, dict):
+                continue
+            for config_list in (game_data.get('navigation_config') or {}).values():
+                if not isinstance(config_list, list):
+                    continue
+                for nav_config_data in config_list:
+                    nav_seq_file = nav_config_data.get('navigation_sequence_path') if isinstance(nav_config_data, dict) else None
+                    if nav_seq_file and "{n}" not in nav_seq_file:
+                        paths.add(os.path.join(template_base_str, nav_seq_file))
+
+        if len(paths) < 2:
+            return
+
+        def load(path):
+            try:
+                load_navigation_sequence(path)
+            except Exception:
+                pass  # Failures are not cached; _load_config logs them when it retries
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+            list(executor.map(load, paths))
 
     def get(self, game_id: str) -> GameConfig:
         """
@@ -168,6 +206,7 @@ class GameRegistry:
         Raises:
             ValueError: If game_id is not registered
         """
+        self._ensure_loaded()
         if game_id not in self._games:
             available = list(self._games.keys())
             raise ValueError(
@@ -178,13 +217,15 @@ class GameRegistry:
 
     def list_games(self) -> list[str]:
         """Get list of registered game IDs."""
+        self._ensure_loaded()
         return list(self._games.keys())
 
     def is_registered(self, game_id: str) -> bool:
         """Check if game is registered."""
+        self._ensure_loaded()
         return game_id in self._games
 
 
-# Global registry instance (initialized on module import)
+# Global registry instance (config.json is loaded on first lookup)
 _config_path = Path(__file__).parent.parent.parent / "config.json"
 GAME_REGISTRY = GameRegistry(_config_path)
@@ -6,111 +6,264 @@ _src_dir = Path(__file__).parent.resolve()
 if str(_src_dir) not in sys.path:
     sys.path.insert(0, str(_src_dir))
 
-import json
+import random
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import requests
-from flask import Flask, request, jsonify
+from requests.adapters import HTTPAdapter
+from flask import Flask, Response, request, jsonify
+from waitress import serve
 from typing import Optional
-from utils.networking import get_local_ip, register_mdns_service
-from utils.process import terminate_process, is_process_running, is_running_elevated
-from utils.monitoring import get_logger, setup_logging
+from utils.networking import get_local_ip_cached, register_mdns_service, update_mdns_status
+from utils.process import terminate_process, is_running_elevated, ProcessTracker
+from utils.monitoring import get_logger, setup_logging, stop_logging
 from utils.data_model import MachineConfig
 from utils.setup_state import SetupState
 from utils.input_blocker import disable_quickedit
+from utils.json_provider import OrjsonProvider
 from utils.cammus_helper import execute_cammus_configuration
 from game_handling import launch, GAME_REGISTRY, Role
 
-# Initialize logging with file output
-log_file = Path(__file__).parent.parent / "scripts" / "simracing_client.log"
-setup_logging(log_file=log_file, console=True)
+_PROJECT_ROOT = _src_dir.parent
+_MACHINE_CONFIG_PATH = _PROJECT_ROOT / "machine_configuration.json"
+_LOG_FILE = _PROJECT_ROOT / "scripts" / "simracing_client.log"
+
+# Initialize logging with file output; records are written from a background
+# thread so request handlers and the heartbeat don't block on file/console I/O
+setup_logging(log_file=_LOG_FILE, console=True, use_queue=True)
 logger = get_logger(__name__)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 HEARTBEAT_INTERVAL = 5
+# Per-status heartbeat periods: faster while a launch is in progress, slower when
+# idle. Must stay well under the orchestrator's 15 s offline timeout.
+HEARTBEAT_INTERVAL_BY_STATUS = {
+    "idle": 10,
+    "configured": HEARTBEAT_INTERVAL,
+    "starting": 2,
+    "running": HEARTBEAT_INTERVAL
+}
+# Unchanged heartbeats are only re-sent this often, as a liveness signal. Must
+# stay under the orchestrator's 15 s offline timeout.
+HEARTBEAT_MAX_SILENCE = 10
+# Retry delay after a single failed heartbeat. Kept short so one dropped
+# request doesn't push the gap past the orchestrator's 15 s offline timeout.
+HEARTBEAT_FIRST_RETRY = 2
+# Upper bound for the retry delay while the orchestrator is unreachable
+HEARTBEAT_MAX_BACKOFF = 60
 ORCHESTRATOR_URL = None
 heartbeat_thread = None
 stop_heartbeat = threading.Event()
+# Set on every state change so the orchestrator hears about it right away
+# instead of on the next scheduled tick
+heartbeat_wakeup = threading.Event()
+# Set when an orchestrator (re-)registers: the next heartbeat is sent even if
+# the state is unchanged, since a restarted orchestrator has forgotten it
+heartbeat_force = threading.Event()
 SERVICE_PORT = 5000
 MACHINE_CONFIG: Optional[MachineConfig] = None
 
 # Cancellation event for stopping running navigation sequences
 cancel_navigation = threading.Event()
+# Cancellation event for an in-progress Cammus configuration, set by /api/stop
+# and on shutdown
+cancel_cammus = threading.Event()
+# Launches run on one reused worker thread; a second start queues behind the
+# first instead of driving the game UI at the same time
+_LAUNCH_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="game-launch")
 
 # Thread-safe state management
 setup_state = SetupState()
 
+# Liveness of the current game's process, shared by the launch thread (which
+# seeds it once the game is up) and the heartbeat thread (which polls it)
+game_process = ProcessTracker()
+
+# Constant error bodies, serialized once at import
+_NOT_CONFIGURED_BODY = orjson.dumps({
+    "status": "error",
+    "message": "Setup must be configured before starting game"
+})
+_NO_GAME_BODY = orjson.dumps({
+    "status": "error",
+    "message": "No game is currently running"
+})
+
+# Heartbeats only ever go to one orchestrator, so a single small keep-alive
+# pool shared across heartbeat threads is enough. This session is reserved for
+# the heartbeat thread: outbound calls made from request handlers must use a
+# session of their own, so a slow call can never hold up a heartbeat.
+_HEARTBEAT_HTTP = requests.Session()
+_HEARTBEAT_ADAPTER = HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0)
+_HEARTBEAT_HTTP.mount("http://", _HEARTBEAT_ADAPTER)
+_HEARTBEAT_HTTP.mount("https://", _HEARTBEAT_ADAPTER)
+
+# mDNS registration, re-announced with the current status on state changes
+MDNS_ZEROCONF = None
+MDNS_SERVICE_INFO = None
+_mdns_lock = threading.Lock()
+
+
+def _announce_state(state: dict):
+    """Publish the new state in the mDNS TXT records"""
+    global MDNS_SERVICE_INFO
+    with _mdns_lock:
+        if MDNS_ZEROCONF and MDNS_SERVICE_INFO:
+            MDNS_SERVICE_INFO = update_mdns_status(
+                MDNS_ZEROCONF, MDNS_SERVICE_INFO, state["status"], state["current_game"]
+            )
+
+
+def _on_state_change(state: dict):
+    """Push a state change out through the heartbeat and mDNS"""
+    heartbeat_wakeup.set()
+    _announce_state(state)
+
 
 def _send_heartbeat():
     """Send periodic status updates to the orchestrator"""
     logger.info("Heartbeat service started")
+    # One payload dict for the thread's lifetime: identity fields are filled in
+    # once and only the volatile fields are overwritten each tick
+    payload = None
+    refresh_ip = False
+    # What the orchestrator last acknowledged, and when
+    last_sent_key = None
+    last_sent_at = 0.0
+    # Consecutive ticks on which the orchestrator could not be reached
+    failures = 0
     while not stop_heartbeat.is_set():
+        # Periods are measured start-to-start on the monotonic clock so request
+        # latency doesn't stretch the interval the orchestrator sees
+        tick_start = time.monotonic()
         if ORCHESTRATOR_URL and MACHINE_CONFIG:
-            try:
-                # Get thread-safe snapshot of current state
-                state = setup_state.snapshot()
-                actual_game = None
-
-                if state["current_game"]:
-                    try:
-                        config = GAME_REGISTRY.get(state["current_game"])
-                        if is_process_running(config.process_name):
-                            actual_game = state["current_game"]
-                            # If game is running but state is not "running", update it
-                            if state["status"] != "running":
-                                logger.info(f"Game {actual_game} is running but state was {state['status']}, updating to running")
-                                setup_state.set_status("running")
-                        else:
-                            # Game process is not running but we have it configured
-                            if state["status"] == "running":
-                                logger.warning(f"Game {state['current_game']} process not found, resetting state to idle")
-                                setup_state.reset()
-                    except ValueError as e:
-                        # Game not in registry
-                        logger.error(f"Game {state['current_game']} not found in registry: {e}")
-
-                # Get fresh snapshot for payload after potential updates
-                state = setup_state.snapshot()
+            if payload is None:
                 payload = {
                     "name": MACHINE_CONFIG.name,
                     "id": MACHINE_CONFIG.id,
                     "ip": MACHINE_CONFIG.ip,
                     "port": MACHINE_CONFIG.port,
-                    "status": state["status"],
-                    "current_game": actual_game,
-                    "session_id": state["session_id"],
-                    "timestamp": time.time()
+                    "status": None,
+                    "current_game": None,
+                    "session_id": None,
+                    "timestamp": 0.0
                 }
-                logger.info(
-                    f"Sending heartbeat to {ORCHESTRATOR_URL} | "
-                    f"Status: {payload['status']} | "
-                    f"Game: {payload['current_game'] or 'None'} | "
-                )
-                response = requests.post(
-                    f"{ORCHESTRATOR_URL}/api/heartbeat",
-                    json=payload,
-                    timeout=2
-                )
-                if response.status_code == 200:
-                    logger.info(f"Heartbeat acknowledged by orchestrator")
+            # The local IP is cached; it is re-queried every 5 minutes, or on the
+            # next tick after a connection failure in case the address changed
+            try:
+                ip = get_local_ip_cached(ttl=0 if refresh_ip else 300)
+            except RuntimeError as e:
+                logger.warning("Could not refresh local IP: %s", e)
+                ip = payload["ip"]
+            refresh_ip = False
+            if ip != payload["ip"]:
+                logger.info("Local IP changed: %s -> %s", payload["ip"], ip)
+                MACHINE_CONFIG.ip = ip
+                payload["ip"] = ip
+            try:
+                # Get a consistent view of the current state. Changes made after
+                # this read wake the thread for another heartbeat
+                heartbeat_wakeup.clear()
+                state = setup_state.current()
+                actual_game = None
+
+                # The process name was resolved at configure time, and the game
+                # process is tracked by PID so each tick doesn't scan the process table
+                if state.current_game and state.process_name:
+                    if game_process.is_running(state.process_name):
+                        actual_game = state.current_game
+                        # If game is running but state is not "running", update it
+                        if state.status != "running":
+                            logger.info("Game %s is running but state was %s, updating to running", actual_game, state.status)
+                            setup_state.set_status("running")
+                            # Re-read only after our own update; this tick reports it
+                            heartbeat_wakeup.clear()
+                            state = setup_state.current()
+                    else:
+                        # Game process is not running but we have it configured.
+                        # A throttled check can report False without scanning, so
+                        # confirm with a fresh scan before resetting a running game
+                        if state.status == "running":
+                            if game_process.track(state.process_name) is not None:
+                                actual_game = state.current_game
+                            else:
+                                logger.warning("Game %s process not found, resetting state to idle", state.current_game)
+                                setup_state.reset()
+                                heartbeat_wakeup.clear()
+                                state = setup_state.current()
+
+                payload["status"] = state.status
+                payload["current_game"] = actual_game
+                payload["session_id"] = state.session_id
+
+                # Skip the POST if the orchestrator already has this state and
+                # has heard from us recently enough to keep the slot online
+                key = (ORCHESTRATOR_URL, payload["ip"], payload["status"], actual_game, payload["session_id"])
+                if heartbeat_force.is_set():
+                    # Forget the last acknowledgement; keep sending until the
+                    # newly registered orchestrator acknowledges one
+                    heartbeat_force.clear()
+                    last_sent_key = None
+                if key == last_sent_key and tick_start - last_sent_at < HEARTBEAT_MAX_SILENCE:
+                    logger.debug("Heartbeat skipped: state unchanged")
                 else:
-                    logger.warning(f"Heartbeat failed: HTTP {response.status_code}")
+                    payload["timestamp"] = time.time()
+                    logger.info(
+                        "Sending heartbeat to %s | Status: %s | Game: %s",
+                        ORCHESTRATOR_URL, payload['status'], payload['current_game'] or 'None'
+                    )
+                    response = _HEARTBEAT_HTTP.post(
+                        f"{ORCHESTRATOR_URL}/api/heartbeat",
+                        data=orjson.dumps(payload),
+                        headers={'Content-Type': 'application/json'},
+                        # Fail fast when the orchestrator host is gone, but give a
+                        # reachable one the full read timeout to answer
+                        timeout=(1.0, 2.0),
+                        allow_redirects=False  # Only the status code is used
+                    )
+                    if response.status_code == 200:
+                        logger.debug("Heartbeat acknowledged by orchestrator")
+                        failures = 0
+                        last_sent_key = key
+                        last_sent_at = tick_start
+                    else:
+                        logger.warning("Heartbeat failed: HTTP %s", response.status_code)
+                        failures += 1
+            except requests.exceptions.ConnectionError as e:
+                logger.error("Heartbeat error: %s", e)
+                refresh_ip = True
+                failures += 1
             except requests.exceptions.RequestException as e:
-                logger.error(f"Heartbeat error: {e}")
-        stop_heartbeat.wait(HEARTBEAT_INTERVAL)
+                logger.error("Heartbeat error: %s", e)
+                failures += 1
+        interval = HEARTBEAT_INTERVAL_BY_STATUS.get(setup_state.status, HEARTBEAT_INTERVAL)
+        if failures == 1:
+            # Retry a single failure quickly so the slot doesn't drop offline
+            interval = min(interval, HEARTBEAT_FIRST_RETRY)
+        elif failures:
+            # Back off exponentially while the orchestrator is unreachable or
+            # unhealthy, with jitter so a room of setups doesn't retry in
+            # lockstep. A state change or a new registration still wakes the
+            # thread immediately.
+            interval = min(interval * 2 ** (failures - 1) * (0.5 + random.random()), HEARTBEAT_MAX_BACKOFF)
+        heartbeat_wakeup.wait(max(0.0, tick_start + interval - time.monotonic()))
     logger.info("Heartbeat service stopped")
 
 @app.route('/api/register_orchestrator', methods=['POST'])
 def register_orchestrator():
     """Register the orchestrator URL to send heartbeats to"""
     global ORCHESTRATOR_URL, heartbeat_thread
-    orchestrator_url = request.json.get('orchestrator_url')
+    data = request.get_json(silent=True) or {}
+    orchestrator_url = data.get('orchestrator_url')
     if not orchestrator_url:
         return jsonify({"error": "Missing orchestrator_url"}), 400
 
     # Validate it's not our own IP (prevent self-heartbeat loop)
-    my_ip = get_local_ip()
+    my_ip = get_local_ip_cached()
     if my_ip in orchestrator_url:
         logger.warning(f"Orchestrator registration - URL contains our own IP: {orchestrator_url}")
 
@@ -121,28 +274,44 @@ def register_orchestrator():
         heartbeat_thread = threading.Thread(target=_send_heartbeat, daemon=True)
         heartbeat_thread.start()
         logger.info(f"Heartbeat thread started (interval: {HEARTBEAT_INTERVAL}s)")
-    return jsonify({
+    else:
+        # Cut short any backoff and bypass the unchanged-state skip so the
+        # (possibly restarted) orchestrator hears from us right away
+        heartbeat_force.set()
+        heartbeat_wakeup.set()
+    return Response(orjson.dumps({
         "status": "success",
         "message": f"Orchestrator registered: {ORCHESTRATOR_URL}",
         "heartbeat_interval": HEARTBEAT_INTERVAL
-    })
+    }), mimetype='application/json')
 
 @app.route('/api/configure', methods=['POST'])
 def configure():
     """Receive configuration from orchestrator"""
-    data = request.json
+    data = request.get_json(silent=True) or {}
     game = data.get('game')
     session_id = data.get('session_id')
     role = data.get('role')
     player_count = data.get('player_count')
     host_ip = data.get('host_ip')
 
+    # Resolve the game once here; later checks use the stored process name
+    try:
+        config = GAME_REGISTRY.get(game)
+    except ValueError as e:
+        logger.error(f"Cannot configure: {e}")
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 400
+
     setup_state.configure(
         game=game,
         session_id=session_id,
         role=role,
         player_count=player_count,
-        host_ip=host_ip
+        host_ip=host_ip,
+        process_name=config.process_name
     )
 
     return jsonify({
@@ -152,7 +321,7 @@ def configure():
     })
 
 
-def _launch_game_async(game: str, role: Role, player_count: Optional[int] = None, host_ip: Optional[str] = None):
+def _launch_game_async(game: str, role: Role, process_name: str, player_count: Optional[int] = None, host_ip: Optional[str] = None):
     """Background thread function to launch game"""
     try:
         # Clear any previous cancellation signal before starting
@@ -162,8 +331,10 @@ def _launch_game_async(game: str, role: Role, player_count: Optional[int] = None
         success = launch(game, role, cancel_event=cancel_navigation, player_count=player_count, host_ip=host_ip)
 
         if success:
+            # Resolve the game's PID once so heartbeats only need an O(1) liveness check
+            pid = game_process.track(process_name)
             setup_state.set_status("running")
-            logger.info(f"Background thread: {game} started successfully")
+            logger.info(f"Background thread: {game} started successfully (PID: {pid})")
         else:
             logger.error(f"Background thread: Failed to start {game}")
             setup_state.reset()
@@ -178,31 +349,26 @@ def start_game():
     """Start the configured game"""
     logger.info("Received start game request.")
 
+    # Read all values from one state so they come from the same configure call
+    state = setup_state.current()
+
     # Validate that setup is configured
-    if not setup_state.is_configured():
-        logger.error(f"Cannot start game: setup is not configured (status: {setup_state.status})")
-        return jsonify({
-            "status": "error",
-            "message": "Setup must be configured before starting game"
-        }), 400
+    if state.status != "configured":
+        logger.error(f"Cannot start game: setup is not configured (status: {state.status})")
+        return Response(_NOT_CONFIGURED_BODY, status=400, mimetype='application/json')
 
     # Get values from state
-    game = setup_state.current_game
-    role = setup_state.role
-    host_ip = setup_state.host_ip
-    player_count = setup_state.player_count
+    game = state.current_game
+    role = state.role
+    host_ip = state.host_ip
+    player_count = state.player_count
     logger.info(f"Starting {game} with role {role}")
 
     # Update state to starting immediately
     setup_state.set_status("starting")
 
     # Launch game in background thread to avoid blocking the response
-    launch_thread = threading.Thread(
-        target=_launch_game_async,
-        args=(game, role, player_count, host_ip),
-        daemon=True
-    )
-    launch_thread.start()
+    _LAUNCH_POOL.submit(_launch_game_async, game, role, state.process_name, player_count, host_ip)
 
     logger.info(f"Game launch initiated in background thread")
     return jsonify({
@@ -217,25 +383,23 @@ def stop_game():
 
     # Signal any running navigation to stop immediately
     cancel_navigation.set()
+    cancel_cammus.set()
     logger.info("Cancellation signal sent to navigation sequence")
 
     # Get current game info
-    game = setup_state.current_game
-    current_status = setup_state.status
+    state = setup_state.current()
+    game = state.current_game
+    current_status = state.status
 
     if not game:
         logger.warning("No game is currently configured")
-        return jsonify({
-            "status": "error",
-            "message": "No game is currently running"
-        }), 400
+        return Response(_NO_GAME_BODY, status=400, mimetype='application/json')
 
     logger.info(f"Attempting to close {game} (status: {current_status})")
 
     try:
-        # Get game config to retrieve process name
-        config = GAME_REGISTRY.get(game)
-        success = terminate_process(config.process_name)
+        process_name = state.process_name
+        success = terminate_process(process_name)
 
         # Always reset state when stop is requested
         # Even if process wasn't found (e.g., during "starting" phase)
@@ -249,7 +413,7 @@ def stop_game():
             })
         else:
             # Process not found, but state still reset
-            logger.warning(f"Process {config.process_name} not found, but state reset to idle")
+            logger.warning(f"Process {process_name} not found, but state reset to idle")
             return jsonify({
                 "status": "success",
                 "message": f"{game} stop requested (process not running), state reset"
@@ -279,7 +443,8 @@ def configure_cammus():
     logger.info("Received Cammus configuration request")
 
     try:
-        success, message = execute_cammus_configuration()
+        cancel_cammus.clear()
+        success, message = execute_cammus_configuration(cancel_event=cancel_cammus)
 
         if success:
             return jsonify({
@@ -302,17 +467,12 @@ def configure_cammus():
 
 
 def _start_server(config: dict):
-    global MACHINE_CONFIG
+    global MACHINE_CONFIG, MDNS_ZEROCONF, MDNS_SERVICE_INFO
 
     disable_quickedit()
 
     # Create MachineConfig with values from config file and runtime values
-    MACHINE_CONFIG = MachineConfig(
-        id=str(config['id']),
-        name=config['name'],
-        ip=get_local_ip(),
-        port=str(SERVICE_PORT)
-    )
+    MACHINE_CONFIG = MachineConfig.from_runtime(config, get_local_ip_cached(), SERVICE_PORT)
 
     logger.info(f"Machine Name: {MACHINE_CONFIG.name}")
     logger.info(f"Machine ID: {MACHINE_CONFIG.id}")
@@ -322,32 +482,43 @@ def _start_server(config: dict):
         logger.info("Admin privileges: YES")
     else:
         logger.warning("Admin privileges: NO - CAMMUS clicks may not work")
+    # Load game configurations before the first request needs them
+    GAME_REGISTRY.list_games()
     logger.info("Registering mDNS service...")
-    zeroconf, service_info = register_mdns_service(config, SERVICE_PORT)
+    MDNS_ZEROCONF, MDNS_SERVICE_INFO = register_mdns_service(config, SERVICE_PORT)
+    setup_state.on_change = _on_state_change
     try:
         logger.info("REST API server starting...")
         logger.info("Waiting for orchestrator to register for heartbeats...")
-        app.run(host='0.0.0.0', port=SERVICE_PORT, debug=False)
+        serve(app, host='0.0.0.0', port=SERVICE_PORT, threads=8, connection_limit=200, channel_timeout=30)
     except KeyboardInterrupt:
         logger.info("Shutdown signal received")
     finally:
         stop_heartbeat.set()
+        heartbeat_wakeup.set()
+        # The pool's worker is joined at interpreter exit, so abort any
+        # navigation in progress and drop queued launches
+        cancel_navigation.set()
+        cancel_cammus.set()
+        _LAUNCH_POOL.shutdown(wait=False, cancel_futures=True)
         if heartbeat_thread and heartbeat_thread.is_alive():
             heartbeat_thread.join(timeout=2)
-        zeroconf.unregister_service(service_info)
-        zeroconf.close()
+        _HEARTBEAT_HTTP.close()
+        setup_state.on_change = None
+        MDNS_ZEROCONF.unregister_service(MDNS_SERVICE_INFO)
+        MDNS_ZEROCONF.close()
         logger.info("Service stopped")
+        stop_logging()
 
 
 if __name__ == "__main__":
-    config_path = Path(__file__).parent.parent / "machine_configuration.json"
+    config_path = _MACHINE_CONFIG_PATH
     if not config_path.exists():
         logger.error(f"Configuration file not found: {config_path}")
         logger.error("Please create machine_configuration.json with 'name' and 'id' fields")
         exit(1)
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = orjson.loads(config_path.read_bytes())
         if 'name' not in config or 'id' not in config:
             logger.error("Configuration must contain 'name' and 'id' fields")
             exit(1)
@@ -355,7 +526,7 @@ if __name__ == "__main__":
         logger.info(f"Loaded configuration from {config_path}")
         _start_server(config)
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Invalid JSON in configuration file: {e}")
         exit(1)
     except Exception as e:
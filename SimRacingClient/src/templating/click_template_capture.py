@@ -37,11 +37,37 @@ from mss import mss
 import pyautogui
 from pathlib import Path
 import json
+import queue
 import sys
+import threading
 from pynput import keyboard
 import tkinter as tk
 from datetime import datetime
 
+# Run as a script from templating/; make the shared utils package importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.screen_capture import virtual_screen_bounds
+
+if sys.platform == 'win32':
+    import ctypes
+    from ctypes import wintypes
+
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+    _GetCursorPos = _user32.GetCursorPos
+    _GetCursorPos.argtypes = [ctypes.POINTER(wintypes.POINT)]
+    _GetCursorPos.restype = wintypes.BOOL
+    _cursor_point = wintypes.POINT()
+
+    def _cursor_position():
+        """Current mouse position, read straight from GetCursorPos."""
+        if not _GetCursorPos(ctypes.byref(_cursor_point)):
+            return pyautogui.position()
+        return _cursor_point.x, _cursor_point.y
+else:
+    def _cursor_position():
+        """Current mouse position."""
+        return pyautogui.position()
+
 
 class ClickTemplateCapturer:
     """Captures templates for click-based UI automation."""
@@ -49,11 +75,24 @@ class ClickTemplateCapturer:
     # Size of the region to capture around the mouse position
     CAPTURE_SIZE = 80  # pixels on each side of mouse (160x160 total)
 
-    def __init__(self, config_name: str = "cammus"):
+    def __init__(self, config_name: str = "cammus", refresh_ms: int = 25):
         self.config_name = config_name
+        # Crosshair polling period; ~40 Hz is plenty for a pointer overlay
+        self.refresh_ms = refresh_ms
         self.running = True
         self.capture_count = 0
         self.click_steps = []
+        # Screen grabber, created on first capture and reused afterwards. mss
+        # keeps per-thread handles, so it is created on the keyboard listener
+        # thread that performs every capture.
+        self._sct = None
+        # Desktop bounds (all monitors) for clamping the capture region; fixed
+        # for the session
+        self._screen_bounds = virtual_screen_bounds()
+        # PNG encoding and disk writes happen on a background thread so the
+        # keyboard listener is free again as soon as the grab is done
+        self._write_queue = queue.Queue()
+        threading.Thread(target=self._writer_loop, daemon=True).start()
 
         # Setup directories - save to unclassified_templates
         self.script_dir = Path(__file__).parent
@@ -64,35 +103,38 @@ class ClickTemplateCapturer:
 
         # Crosshair overlay
         self.crosshair_root = None
-        self.crosshair_windows = []
+        self.crosshair_canvas = None
         self.setup_crosshair()
 
     def setup_crosshair(self):
-        """Create crosshair overlay windows."""
+        """Create the crosshair overlay."""
         self.crosshair_root = tk.Tk()
         self.crosshair_root.withdraw()
 
-        size = 40
+        self._crosshair_size = 40
         thickness = 2
-
-        # Create horizontal and vertical crosshair lines
-        for _ in range(2):
-            window = tk.Toplevel(self.crosshair_root)
-            window.overrideredirect(True)
-            window.attributes('-topmost', True)
-            window.attributes('-transparentcolor', 'white')
-            window.config(bg='white')
-
-            canvas = tk.Canvas(window, bg='white', highlightthickness=0)
-            canvas.pack()
-
-            self.crosshair_windows.append({
-                'window': window,
-                'canvas': canvas,
-                'size': size,
-                'thickness': thickness
-            })
-
+        # Always show lime color - crosshair is always ready
+        color = 'lime'
+
+        # One borderless, click-through window covering the whole desktop. The
+        # two lines are created once and following the mouse only moves them.
+        left, top, width, height = virtual_screen_bounds()
+        self._overlay_origin = (left, top)
+
+        window = tk.Toplevel(self.crosshair_root)
+        window.overrideredirect(True)
+        window.attributes('-topmost', True)
+        window.attributes('-transparentcolor', 'white')
+        window.config(bg='white')
+        window.geometry(f"{width}x{height}+{left}+{top}")
+
+        canvas = tk.Canvas(window, bg='white', highlightthickness=0, width=width, height=height)
+        canvas.pack()
+        self._h_line = canvas.create_line(0, 0, 0, 0, fill=color, width=thickness)
+        self._v_line = canvas.create_line(0, 0, 0, 0, fill=color, width=thickness)
+        self.crosshair_canvas = canvas
+
+        self._crosshair_pos = None
         self.update_crosshair()
 
     def update_crosshair(self):
@@ -101,33 +143,19 @@ class ClickTemplateCapturer:
             return
 
         try:
-            x, y = pyautogui.position()
-
-            # Always show lime color - crosshair is always ready
-            color = 'lime'
-
-            if len(self.crosshair_windows) >= 2:
-                # Horizontal line
-                ch = self.crosshair_windows[0]
-                size = ch['size']
-                thickness = ch['thickness']
-
-                ch['window'].geometry(f"{size * 2}x{thickness}+{x - size}+{y - thickness // 2}")
-                ch['canvas'].config(width=size * 2, height=thickness)
-                ch['canvas'].delete('all')
-                ch['canvas'].create_line(0, thickness // 2, size * 2, thickness // 2,
-                                        fill=color, width=thickness)
-
-                # Vertical line
-                ch = self.crosshair_windows[1]
-                ch['window'].geometry(f"{thickness}x{size * 2}+{x - thickness // 2}+{y - size}")
-                ch['canvas'].config(width=thickness, height=size * 2)
-                ch['canvas'].delete('all')
-                ch['canvas'].create_line(thickness // 2, 0, thickness // 2, size * 2,
-                                        fill=color, width=thickness)
+            x, y = _cursor_position()
+
+            # Only move the lines when the mouse has moved
+            if (x, y) != self._crosshair_pos and self.crosshair_canvas:
+                self._crosshair_pos = (x, y)
+                cx = x - self._overlay_origin[0]
+                cy = y - self._overlay_origin[1]
+                size = self._crosshair_size
+                self.crosshair_canvas.coords(self._h_line, cx - size, cy, cx + size, cy)
+                self.crosshair_canvas.coords(self._v_line, cx, cy - size, cx, cy + size)
 
             if self.crosshair_root:
-                self.crosshair_root.after(10, self.update_crosshair)
+                self.crosshair_root.after(self.refresh_ms, self.update_crosshair)
         except Exception:
             pass
 
@@ -145,34 +173,38 @@ class ClickTemplateCapturer:
 
         # Calculate capture region
         half_size = self.CAPTURE_SIZE
-        screen_w, screen_h = pyautogui.size()
 
-        left = max(0, x - half_size)
-        top = max(0, y - half_size)
-        right = min(screen_w, x + half_size)
-        bottom = min(screen_h, y + half_size)
+        # Clamp to the desktop rather than the primary monitor, so captures on
+        # secondary monitors (possibly at negative coordinates) keep their size
+        screen_left, screen_top, screen_w, screen_h = self._screen_bounds
+        left = max(screen_left, x - half_size)
+        top = max(screen_top, y - half_size)
+        right = min(screen_left + screen_w, x + half_size)
+        bottom = min(screen_top + screen_h, y + half_size)
 
         width = right - left
         height = bottom - top
 
         # Capture screenshot
-        sct = mss()
+        if self._sct is None:
+            self._sct = mss()
         monitor = {
             "top": top,
             "left": left,
             "width": width,
             "height": height
         }
-        screenshot = sct.grab(monitor)
-        img = np.array(screenshot)
-        img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+        screenshot = self._sct.grab(monitor)
+        # Wrap mss's raw BGRA buffer without copying it
+        img = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 4)
 
         # Save template with timestamp for uniqueness
         self.capture_count += 1
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"{self.config_name}_step_{self.capture_count:03d}_{timestamp}.png"
         template_path = self.templates_dir / filename
-        cv2.imwrite(str(template_path), img)
+        # Drop the constant alpha channel with a slice instead of a colour conversion
+        self._write_queue.put((template_path, img[:, :, :3]))
 
         # Record step
         step = {
@@ -187,6 +219,21 @@ class ClickTemplateCapturer:
 
         return filename
 
+    def _writer_loop(self):
+        """Encode and write queued templates off the listener thread."""
+        while True:
+            template_path, img = self._write_queue.get()
+            try:
+                ok, buffer = cv2.imencode('.png', img, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+                if ok:
+                    template_path.write_bytes(buffer.tobytes())
+                else:
+                    print(f"  Warning: could not encode {template_path.name}")
+            except Exception as e:
+                print(f"  Warning: could not save {template_path.name}: {e}")
+            finally:
+                self._write_queue.task_done()
+
     def on_press(self, key):
         """Handle keyboard events."""
         try:
@@ -216,8 +263,12 @@ class ClickTemplateCapturer:
     def save_click_steps(self):
         """Save click steps to JSON file in unclassified_templates."""
         click_steps_path = self.templates_dir / "click_steps.json"
-        with open(click_steps_path, 'w') as f:
+        # Write to a temporary file and swap it in so an interrupted save
+        # never leaves a truncated click_steps.json behind
+        tmp_path = click_steps_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
             json.dump(self.click_steps, f, indent=2)
+        tmp_path.replace(click_steps_path)
         return click_steps_path
 
     def start(self):
@@ -254,6 +305,16 @@ class ClickTemplateCapturer:
         else:
             kb_listener.join()
 
+        # Finish writing any templates still in the queue
+        self._write_queue.join()
+
+        if self._sct is not None:
+            try:
+                self._sct.close()
+            except Exception:
+                pass
+            self._sct = None
+
         # Save results
         if self.click_steps:
             steps_path = self.save_click_steps()
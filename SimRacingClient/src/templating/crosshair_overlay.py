@@ -2,11 +2,13 @@ import tkinter as tk
 import pyautogui
 
 class CrosshairOverlay:
-    def __init__(self, size=20, color='red', thickness=1):
+    def __init__(self, size=20, color='red', thickness=1, refresh_ms=25):
         self.size = size
         self.color = color
         self.thickness = thickness
+        self.refresh_ms = refresh_ms
         self.running = True
+        self._last_xy = None
         
         self.root = tk.Tk()
         self.root.withdraw()
@@ -15,7 +17,10 @@ class CrosshairOverlay:
         self.create_crosshair()
         
     def create_crosshair(self):
-        for _ in range(4):
+        # Horizontal and vertical line; each is drawn once and only its window moves
+        for horizontal in (True, False):
+            width, height = (self.size * 2, self.thickness) if horizontal else (self.thickness, self.size * 2)
+
             window = tk.Toplevel(self.root)
             window.overrideredirect(True)
             window.attributes('-topmost', True)
@@ -23,8 +28,14 @@ class CrosshairOverlay:
             window.config(bg='white')
             
             canvas = tk.Canvas(window, bg='white', highlightthickness=0, 
-                             width=self.size * 2, height=self.thickness)
+                             width=width, height=height)
             canvas.pack()
+            if horizontal:
+                canvas.create_line(0, self.thickness // 2, self.size * 2, self.thickness // 2,
+                                   fill=self.color, width=self.thickness)
+            else:
+                canvas.create_line(self.thickness // 2, 0, self.thickness // 2, self.size * 2,
+                                   fill=self.color, width=self.thickness)
             
             self.windows.append({'window': window, 'canvas': canvas})
         
@@ -37,18 +48,13 @@ class CrosshairOverlay:
         try:
             x, y = pyautogui.position()
             
-            self.windows[0]['window'].geometry(f"{self.size * 2}x{self.thickness}+{x - self.size}+{y - self.thickness // 2}")
-            self.windows[0]['canvas'].delete('all')
-            self.windows[0]['canvas'].create_line(0, self.thickness // 2, self.size * 2, self.thickness // 2, 
-                                                  fill=self.color, width=self.thickness)
-            
-            self.windows[1]['window'].geometry(f"{self.thickness}x{self.size * 2}+{x - self.thickness // 2}+{y - self.size}")
-            self.windows[1]['canvas'].config(width=self.thickness, height=self.size * 2)
-            self.windows[1]['canvas'].delete('all')
-            self.windows[1]['canvas'].create_line(self.thickness // 2, 0, self.thickness // 2, self.size * 2, 
-                                                  fill=self.color, width=self.thickness)
+            # Nothing to do while the mouse is still
+            if (x, y) != self._last_xy:
+                self._last_xy = (x, y)
+                self.windows[0]['window'].geometry(f"{self.size * 2}x{self.thickness}+{x - self.size}+{y - self.thickness // 2}")
+                self.windows[1]['window'].geometry(f"{self.thickness}x{self.size * 2}+{x - self.thickness // 2}+{y - self.size}")
             
-            self.root.after(10, self.update_position)
+            self.root.after(self.refresh_ms, self.update_position)
         except Exception:
             pass
     
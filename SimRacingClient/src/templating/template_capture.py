@@ -4,15 +4,24 @@ from mss import mss
 import pyautogui
 from pathlib import Path
 import json
-import time
+import queue
+import threading
 from pynput import keyboard
+import sys
 import tkinter as tk
 from datetime import datetime
 
+# Run as a script from templating/; make the shared utils package importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.screen_capture import virtual_screen_bounds
+
 # Use absolute path relative to this script's location
 SCRIPT_DIR = Path(__file__).parent
 TEMPLATES_DIR = SCRIPT_DIR / "unclassified_templates"
 TEMPLATES_DATA = TEMPLATES_DIR / "templates.json"
+# Longest wait for the Tk thread to hide the crosshair before a grab goes
+# ahead anyway (e.g. the mainloop has already exited)
+CROSSHAIR_HIDE_TIMEOUT = 0.5
 
 class TemplateCapturer:
     on_click_counter = 0
@@ -23,67 +32,117 @@ class TemplateCapturer:
         self.running = True
         self.show_position = True
         self.crosshair_root = None
-        self.crosshair_windows = []
+        self.crosshair_canvas = None
+        # Screen grabber, created on first capture and reused afterwards. mss
+        # keeps per-thread handles, so it is created on the writer thread
+        # that performs every grab.
+        self._sct = None
+        # Grabs, PNG encoding and disk writes happen on a background thread so
+        # the mouse hook callback returns immediately
+        self._write_queue = queue.Queue()
+        threading.Thread(target=self._writer_loop, daemon=True).start()
         TEMPLATES_DIR.mkdir(exist_ok=True)
+        # Existing entries are loaded once; new captures are appended in memory
+        # and templates.json is written once when the tool exits
+        self._templates = self.load_templates_data()
         self.setup_crosshair()
     
     def setup_crosshair(self):
         self.crosshair_root = tk.Tk()
         self.crosshair_root.withdraw()
         
-        size = 30
+        self._crosshair_size = 30
         color = 'lime'
         thickness = 3
         
-        for _ in range(2):
-            window = tk.Toplevel(self.crosshair_root)
-            window.overrideredirect(True)
-            window.attributes('-topmost', True)
-            window.attributes('-transparentcolor', 'white')
-            window.config(bg='white')
-            
-            canvas = tk.Canvas(window, bg='white', highlightthickness=0)
-            canvas.pack()
-            
-            self.crosshair_windows.append({
-                'window': window, 
-                'canvas': canvas,
-                'size': size,
-                'color': color,
-                'thickness': thickness
-            })
-        
-        self.update_crosshair()
+        # One borderless, click-through window covering the whole desktop; the
+        # two lines are created once and following the mouse only moves them
+        left, top, width, height = virtual_screen_bounds()
+        self._overlay_origin = (left, top)
+        
+        window = tk.Toplevel(self.crosshair_root)
+        window.overrideredirect(True)
+        window.attributes('-topmost', True)
+        window.attributes('-transparentcolor', 'white')
+        window.config(bg='white')
+        window.geometry(f"{width}x{height}+{left}+{top}")
+        
+        canvas = tk.Canvas(window, bg='white', highlightthickness=0, width=width, height=height)
+        canvas.pack()
+        self._h_line = canvas.create_line(0, 0, 0, 0, fill=color, width=thickness)
+        self._v_line = canvas.create_line(0, 0, 0, 0, fill=color, width=thickness)
+        self.crosshair_canvas = canvas
+        
+        # The crosshair is moved by pynput mouse events (see _on_move) instead
+        # of a polling loop, so it costs nothing while the mouse is still
+        self._pending_pos = None
+        self._redraw_pending = False
+        self._crosshair_hidden = False
+        self.move_crosshair(*pyautogui.position())
     
-    def update_crosshair(self):
-        if not self.running or not self.crosshair_root:
+    def move_crosshair(self, x, y):
+        if not self.running or not self.crosshair_canvas or self._crosshair_hidden:
             return
         
         try:
-            x, y = pyautogui.position()
-            
-            if len(self.crosshair_windows) >= 2:
-                ch = self.crosshair_windows[0]
-                size = ch['size']
-                thickness = ch['thickness']
-                
-                ch['window'].geometry(f"{size * 2}x{thickness}+{x - size}+{y - thickness // 2}")
-                ch['canvas'].config(width=size * 2, height=thickness)
-                ch['canvas'].delete('all')
-                ch['canvas'].create_line(0, thickness // 2, size * 2, thickness // 2, 
-                                        fill=ch['color'], width=thickness)
-                
-                ch = self.crosshair_windows[1]
-                ch['window'].geometry(f"{thickness}x{size * 2}+{x - thickness // 2}+{y - size}")
-                ch['canvas'].config(width=thickness, height=size * 2)
-                ch['canvas'].delete('all')
-                ch['canvas'].create_line(thickness // 2, 0, thickness // 2, size * 2, 
-                                        fill=ch['color'], width=thickness)
-            
-            if self.crosshair_root:
-                self.crosshair_root.after(10, self.update_crosshair)
+            cx = x - self._overlay_origin[0]
+            cy = y - self._overlay_origin[1]
+            size = self._crosshair_size
+            self.crosshair_canvas.coords(self._h_line, cx - size, cy, cx + size, cy)
+            self.crosshair_canvas.coords(self._v_line, cx, cy - size, cx, cy + size)
+        except Exception:
+            pass
+    
+    def _on_move(self, x, y):
+        # Runs on the pynput listener thread: record the position and hand the
+        # redraw to the Tk thread, coalescing moves that arrive before it runs
+        self._pending_pos = (x, y)
+        if self._redraw_pending or not self.running or not self.crosshair_root:
+            return
+        self._redraw_pending = True
+        try:
+            self.crosshair_root.after_idle(self._redraw_crosshair)
+        except Exception:
+            self._redraw_pending = False
+    
+    def _redraw_crosshair(self):
+        self._redraw_pending = False
+        if self._pending_pos is not None:
+            self.move_crosshair(*self._pending_pos)
+    
+    def _hide_crosshair(self, hidden):
+        # Runs on the Tk thread: collapse both lines and flush the redraw so
+        # the crosshair is off screen before the writer thread grabs
+        self._crosshair_hidden = True
+        try:
+            self.crosshair_canvas.coords(self._h_line, 0, 0, 0, 0)
+            self.crosshair_canvas.coords(self._v_line, 0, 0, 0, 0)
+            self.crosshair_canvas.update_idletasks()
         except Exception:
             pass
+        hidden.set()
+    
+    def _show_crosshair(self):
+        self._crosshair_hidden = False
+        self._redraw_crosshair()
+    
+    def _grab_without_crosshair(self, monitor):
+        """Grab a region with the crosshair hidden, as soon as Tk has hidden it."""
+        hidden = threading.Event()
+        try:
+            self.crosshair_root.after(0, self._hide_crosshair, hidden)
+        except Exception:
+            hidden.set()  # Tk is gone; nothing left to hide
+        hidden.wait(CROSSHAIR_HIDE_TIMEOUT)
+        try:
+            if self._sct is None:
+                self._sct = mss()
+            return self._sct.grab(monitor)
+        finally:
+            try:
+                self.crosshair_root.after(0, self._show_crosshair)
+            except Exception:
+                self._crosshair_hidden = False
     
     def load_templates_data(self):
         if TEMPLATES_DATA.exists():
@@ -99,29 +158,28 @@ class TemplateCapturer:
         return []
 
     def save_templates_data(self, data):
-        with open(TEMPLATES_DATA, 'w') as f:
+        # Write to a temporary file and swap it in so an interrupted save
+        # never leaves a truncated templates.json behind
+        tmp_path = TEMPLATES_DATA.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
             json.dump(data, f, indent=2)
+        tmp_path.replace(TEMPLATES_DATA)
     
     def capture_region(self, name, x1, y1, x2, y2):
         x1, x2 = min(x1, x2), max(x1, x2)
         y1, y2 = min(y1, y2), max(y1, y2)
         
-        time.sleep(0.1)
-        
-        sct = mss()
         monitor = {
             "top": y1,
             "left": x1,
             "width": x2 - x1,
             "height": y2 - y1
         }
-        screenshot = sct.grab(monitor)
-        img = np.array(screenshot)
-        img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
         
         template_filename = f"{name}.png"
         template_path = TEMPLATES_DIR / template_filename
-        cv2.imwrite(str(template_path), img)
+        # The grab runs on the writer thread once the crosshair is hidden
+        self._write_queue.put((template_path, monitor))
         
         screen_w, screen_h = pyautogui.size()
         region_relative = [
@@ -131,7 +189,7 @@ class TemplateCapturer:
             y2 / screen_h
         ]
 
-        templates = self.load_templates_data()
+        templates = self._templates
         templates.append({
             "options": [
                 {
@@ -141,13 +199,31 @@ class TemplateCapturer:
                 }
             ]
         })
-        self.save_templates_data(templates)
 
         print(f"\n✓ Captured: {name}")
-        print(f"  Size: {img.shape[1]}x{img.shape[0]} pixels")
+        print(f"  Size: {monitor['width']}x{monitor['height']} pixels")
         print(f"  Region: {region_relative}")
         print(f"  Total templates: {len(templates)}")
     
+    def _writer_loop(self):
+        """Grab, encode and write queued templates off the listener thread."""
+        while True:
+            template_path, monitor = self._write_queue.get()
+            try:
+                screenshot = self._grab_without_crosshair(monitor)
+                # Wrap mss's raw BGRA buffer without copying it, and drop the
+                # constant alpha channel with a slice instead of a colour conversion
+                img = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 4)[:, :, :3]
+                ok, buffer = cv2.imencode('.png', img, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+                if ok:
+                    template_path.write_bytes(buffer.tobytes())
+                else:
+                    print(f"  Warning: could not encode {template_path.name}")
+            except Exception as e:
+                print(f"  Warning: could not save {template_path.name}: {e}")
+            finally:
+                self._write_queue.task_done()
+    
     def on_press(self, key):
         try:
             if key.char == 's':
@@ -206,7 +282,7 @@ class TemplateCapturer:
         print("=" * 60 + "\n")
         
         kb_listener = keyboard.Listener(on_press=self.on_press) # type: ignore
-        mouse_listener = mouse.Listener(on_click=self.on_click)
+        mouse_listener = mouse.Listener(on_click=self.on_click, on_move=self._on_move)
         
         kb_listener.start()
         mouse_listener.start()
@@ -221,8 +297,18 @@ class TemplateCapturer:
         
         mouse_listener.stop()
         
-        templates = self.load_templates_data()
-        print(f"\n✓ Saved {len(templates)} template(s) to {TEMPLATES_DATA}")
+        # Finish writing any templates still in the queue
+        self._write_queue.join()
+        
+        if self._sct is not None:
+            try:
+                self._sct.close()
+            except Exception:
+                pass
+            self._sct = None
+        
+        self.save_templates_data(self._templates)
+        print(f"\n✓ Saved {len(self._templates)} template(s) to {TEMPLATES_DATA}")
 
 def main():
     capturer = TemplateCapturer(game_name="f1_22")
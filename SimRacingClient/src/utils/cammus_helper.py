@@ -7,9 +7,11 @@ software setup sequence using template-based click automation.
 
 import sys
 import json
+import os
+import threading
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 # When spawned as an elevated subprocess (__main__), src/ may not be on the
 # path yet.  Insert it before any local imports so they resolve correctly.
@@ -19,31 +21,63 @@ if __name__ == "__main__":
 from utils.process import is_process_running, launch_process_elevated, is_running_elevated
 from utils.focus_window import _wait_and_focus_window
 from utils.click_navigator import click_template_if_found
+from utils.screen_capture import close_grabber
+from utils.retry import backoff_delays
+from utils.template_cache import load_template
 from utils.monitoring import get_logger
 
 logger = get_logger(__name__)
 
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
+_CAMMUS_CONFIG_PATH = _PROJECT_ROOT / "cammus_config.json"
+_TEMPLATES_DIR = _PROJECT_ROOT / "templates"
+# Passed to the elevated subprocess that re-runs this module
+_SCRIPT_PATH = str(Path(__file__).resolve())
+
+# Parsed JSON files keyed by path, stored with the mtime they were read at
+_JSON_CACHE: Dict[str, Tuple[int, Any]] = {}
+
+
+def _load_json_cached(path: Path) -> Any:
+    """Parse a JSON file, reusing the previous result while its mtime is unchanged.
+
+    The returned object is shared between callers and must not be modified.
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON (not cached)
+    """
+    path_str = str(path)
+    mtime = os.stat(path_str).st_mtime_ns
+    cached = _JSON_CACHE.get(path_str)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path_str, 'r') as f:
+        data = json.load(f)
+    _JSON_CACHE[path_str] = (mtime, data)
+    return data
+
 
 def load_cammus_config() -> Optional[dict]:
     """Load Cammus configuration from cammus_config.json.
 
+    The parsed file is cached and only re-read after it changes on disk.
+
     Returns:
         Configuration dictionary if successful, None otherwise.
     """
-    config_path = Path(__file__).parent.parent.parent / "cammus_config.json"
-    if not config_path.exists():
-        logger.error(f"Cammus config not found: {config_path}")
-        return None
-
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        return _load_json_cached(_CAMMUS_CONFIG_PATH)
+    except FileNotFoundError:
+        logger.error(f"Cammus config not found: {_CAMMUS_CONFIG_PATH}")
+        return None
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON in cammus_config.json: {e}")
         return None
 
 
-def _execute_cammus_configuration_direct() -> tuple[bool, str]:
+def _execute_cammus_configuration_direct(cancel_event: Optional[threading.Event] = None) -> tuple[bool, str]:
     """
     Execute Cammus configuration directly in the current process.
 
@@ -52,9 +86,16 @@ def _execute_cammus_configuration_direct() -> tuple[bool, str]:
     (either the main process is elevated, or this module was spawned as an
     elevated subprocess via __main__).
 
+    Args:
+        cancel_event: Optional threading.Event; when set, the startup wait,
+                      window wait and click retries stop early.
+
     Returns:
         Tuple of (success, message)
     """
+    if cancel_event is None:
+        cancel_event = threading.Event()  # Never set; keeps the waits below uniform
+
     config = load_cammus_config()
     if not config:
         return False, "Failed to load cammus_config.json"
@@ -62,26 +103,40 @@ def _execute_cammus_configuration_direct() -> tuple[bool, str]:
     if not config.get('enabled', False):
         return False, "Cammus configuration is disabled"
 
-    project_root = Path(__file__).parent.parent.parent
-    template_base = project_root / "templates"
-    template_dir = template_base / config.get('template_dir', 'CAMMUS')
+    template_dir = _TEMPLATES_DIR / config.get('template_dir', 'CAMMUS')
 
     # Load click steps
     click_steps_file = config.get('click_steps_file', 'click_steps.json')
     click_steps_path = template_dir / click_steps_file
 
-    if not click_steps_path.exists():
-        return False, f"Click steps file not found: {click_steps_path}"
-
     try:
-        with open(click_steps_path, 'r') as f:
-            click_steps = json.load(f)
+        click_steps = _load_json_cached(click_steps_path)
+    except FileNotFoundError:
+        return False, f"Click steps file not found: {click_steps_path}"
     except json.JSONDecodeError as e:
         return False, f"Invalid JSON in click_steps.json: {e}"
 
     if not click_steps:
         return False, "No click steps configured"
 
+    # Validate and resolve every step before launching anything, so a broken
+    # configuration fails immediately and the click loop only reads prepared values.
+    # Templates are decoded into the cache here, so retries only re-decode a PNG
+    # that was changed on disk (the cache is keyed by mtime).
+    steps = []
+    for i, step in enumerate(click_steps, 1):
+        template_file = step.get('template')
+        if not template_file:
+            logger.error(f"Step {i} missing 'template' field")
+            return False, f"Step {i} missing template field"
+        template_path = str(template_dir / template_file)
+        try:
+            load_template(template_path)
+        except ValueError:
+            logger.error(f"Step {i} template not found or unreadable: {template_path}")
+            return False, f"Step {i} template not found: {template_file}"
+        steps.append((template_path, step.get('double_click', False), template_file))
+
     logger.info(f"Starting Cammus configuration ({len(click_steps)} steps)")
 
     # Launch software if needed
@@ -99,7 +154,8 @@ def _execute_cammus_configuration_direct() -> tuple[bool, str]:
                     return False, "Failed to launch Cammus software (user may have denied UAC prompt)"
                 # Wait for software to load past splash screen
                 logger.info(f"Waiting {startup_delay}s for software to load...")
-                time.sleep(startup_delay)
+                if cancel_event.wait(startup_delay):
+                    return False, "Cancelled"
             except Exception as e:
                 return False, f"Failed to launch Cammus software: {e}"
         else:
@@ -107,7 +163,9 @@ def _execute_cammus_configuration_direct() -> tuple[bool, str]:
 
         # Focus window if specified
         if window_title:
-            if not _wait_and_focus_window(window_title, max_attempts=10):
+            if not _wait_and_focus_window(window_title, timeout=20, cancel_event=cancel_event):
+                if cancel_event.is_set():
+                    return False, "Cancelled"
                 logger.warning(f"Could not focus window: {window_title}")
     else:
         logger.warning("No executable_path or process_name configured - assuming software is already open")
@@ -118,38 +176,37 @@ def _execute_cammus_configuration_direct() -> tuple[bool, str]:
     retry_delay = config.get('retry_delay', 1.0)
     click_delay = config.get('click_delay', 0.5)
 
-    for i, step in enumerate(click_steps, 1):
-        template_file = step.get('template')
-        double_click = step.get('double_click', False)
+    for i, (template_path, double_click, template_file) in enumerate(steps, 1):
+        logger.info(f"Step {i}/{len(steps)}: Looking for {template_file}...")
 
-        if not template_file:
-            logger.error(f"Step {i} missing 'template' field")
-            return False, f"Step {i} missing template field"
-
-        template_path = str(template_dir / template_file)
-        logger.info(f"Step {i}/{len(click_steps)}: Looking for {template_file}...")
-
-        # Retry loop
+        # Retry loop: poll quickly at first and back off towards retry_delay,
+        # keeping the same overall time budget as max_retries fixed-delay attempts
         clicked = False
-        for attempt in range(max_retries):
+        delays = backoff_delays(time.monotonic() + (max_retries - 1) * retry_delay, cap=retry_delay)
+        attempt = 0
+        while True:
+            attempt += 1
             if click_template_if_found(template_path, threshold, click_delay, double_click):
                 click_type = "double-clicked" if double_click else "clicked"
-                logger.info(f"Step {i}/{len(click_steps)}: {click_type} {template_file}")
+                logger.info(f"Step {i}/{len(steps)}: {click_type} {template_file}")
                 clicked = True
                 break
 
-            if attempt < max_retries - 1:
-                logger.debug(f"Attempt {attempt + 1}/{max_retries} failed, retrying...")
-                time.sleep(retry_delay)
+            delay = next(delays, None)
+            if delay is None:
+                break
+            logger.debug(f"Attempt {attempt} failed, retrying...")
+            if cancel_event.wait(delay):
+                return False, "Cancelled"
 
         if not clicked:
-            return False, f"Step {i} failed: Could not find {template_file} after {max_retries} attempts"
+            return False, f"Step {i} failed: Could not find {template_file} after {attempt} attempts"
 
     logger.info(f"Cammus configuration completed successfully ({len(click_steps)} steps)")
     return True, f"Cammus configuration completed ({len(click_steps)} steps)"
 
 
-def execute_cammus_configuration() -> tuple[bool, str]:
+def execute_cammus_configuration(cancel_event: Optional[threading.Event] = None) -> tuple[bool, str]:
     """
     Execute Cammus software configuration (public entry point).
 
@@ -160,18 +217,26 @@ def execute_cammus_configuration() -> tuple[bool, str]:
     endpoint and the orchestrator are completely unaffected — the elevation
     is an internal implementation detail.
 
+    Args:
+        cancel_event: Optional threading.Event to stop the sequence early.
+                      Only honoured when running in-process; the elevated
+                      subprocess cannot observe it.
+
     Returns:
         Tuple of (success, message)
     """
     if is_running_elevated():
-        return _execute_cammus_configuration_direct()
+        try:
+            return _execute_cammus_configuration_direct(cancel_event)
+        finally:
+            # Runs on a server worker thread; release its screen grabber
+            close_grabber()
 
     # Not elevated – spawn this module as an elevated subprocess.
     logger.info("Not elevated – spawning elevated subprocess for CAMMUS configuration")
-    script_path = str(Path(__file__).resolve())
     success = launch_process_elevated(
         Path(sys.executable),
-        parameters=f'"{script_path}"',
+        parameters=f'"{_SCRIPT_PATH}"',
         wait=True
     )
 
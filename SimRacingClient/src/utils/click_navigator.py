@@ -15,12 +15,13 @@ import sys
 import time
 
 import cv2
-import numpy as np
 import pyautogui
 from typing import List, Optional, Tuple
 from pathlib import Path
 
 from utils.monitoring import get_logger
+from utils.template_cache import load_template
+from utils.screen_capture import grab_screen
 
 logger = get_logger(__name__)
 
@@ -164,16 +165,13 @@ def find_template_on_screen(
             x, y, confidence = result
             pyautogui.click(x, y)
     """
-    # Load template image
-    template = cv2.imread(template_path, cv2.IMREAD_COLOR)
-    if template is None:
-        raise ValueError(f"Could not load template image from {template_path}")
+    # Load template image (decoded once, then served from the cache)
+    template = load_template(template_path)
 
     template_height, template_width = template.shape[:2]
 
     # Capture full screen
-    screenshot = pyautogui.screenshot()
-    screenshot_np = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+    screenshot_np = grab_screen()
 
     # Perform template matching
     result = cv2.matchTemplate(screenshot_np, template, method)
@@ -5,10 +5,10 @@ This module contains all Pydantic BaseModel classes used throughout the applicat
 providing centralized data validation and type safety.
 """
 
+import os
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Union
-import json
-from pydantic import BaseModel, Field, validator
+from typing import Dict, List, Literal, Optional, Tuple, Union
+from pydantic import BaseModel, Field, TypeAdapter, validator
 
 
 # ============================================================================
@@ -39,6 +39,21 @@ class MachineConfig(BaseModel):
     ip: str = Field(..., description="Machine's local IP address")
     port: str = Field(..., description="Service port number")
 
+    @classmethod
+    def from_runtime(cls, config: dict, ip: str, port: int) -> "MachineConfig":
+        """
+        Build the machine config from machine_configuration.json plus runtime values.
+
+        Args:
+            config: Parsed machine_configuration.json (must contain 'id' and 'name')
+            ip: Local IP address the service is reachable on
+            port: Port the REST API listens on
+
+        Returns:
+            MachineConfig with all fields normalized to strings
+        """
+        return cls(id=str(config['id']), name=config['name'], ip=ip, port=str(port))
+
 
 # ============================================================================
 # Navigation Template Models (from screen_navigator.py)
@@ -106,6 +121,38 @@ class NavigationSequence(BaseModel):
     steps: List[Step] = Field(..., description="Ordered list of navigation steps")
 
 
+# Parses and validates a whole sequence file in one pass (pydantic-core)
+_STEP_LIST_ADAPTER = TypeAdapter(List[Step])
+
+# Parsed sequences keyed by (path, mtime) so files shared by several configs are read once
+_SEQUENCE_CACHE: Dict[Tuple[str, float], NavigationSequence] = {}
+
+
+def load_navigation_sequence(path: Union[str, Path]) -> NavigationSequence:
+    """
+    Load a navigation sequence JSON file, reusing the parsed result if unchanged.
+
+    Args:
+        path: Path to the navigation sequence JSON file (str or Path)
+
+    Returns:
+        NavigationSequence with the validated steps
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        pydantic.ValidationError: If the file is not valid JSON or fails validation
+    """
+    path = os.fspath(path)
+    key = (path, os.stat(path).st_mtime)
+    sequence = _SEQUENCE_CACHE.get(key)
+    if sequence is None:
+        with open(path, 'rb') as f:
+            steps = _STEP_LIST_ADAPTER.validate_json(f.read())
+        sequence = NavigationSequence(steps=steps)
+        _SEQUENCE_CACHE[key] = sequence
+    return sequence
+
+
 # ============================================================================
 # Pre-Launch Configuration Models (for CAMMUS, etc.)
 # ============================================================================
@@ -226,11 +273,7 @@ class NavigationConfig(BaseModel):
         if not full_path.exists():
             raise FileNotFoundError(f"Navigation sequence file not found: {full_path}")
 
-        with open(full_path, 'r') as f:
-            steps_data = json.load(f)
-
-        steps = [Step(**step_data) for step_data in steps_data]
-        self.navigation_sequence = NavigationSequence(steps=steps)
+        self.navigation_sequence = load_navigation_sequence(full_path)
 
 
 class GameConfig(BaseModel):
@@ -37,6 +37,7 @@ import json
 import time
 
 from utils.click_navigator import click_template_if_found
+from utils.retry import backoff_delays
 from utils.monitoring import get_logger
 
 logger = get_logger(__name__)
@@ -79,20 +80,27 @@ def main():
         template_path = str(Path(template_dir) / template_file)
         logger.info(f"Step {i}/{len(click_steps)}: Looking for {template_file}...")
 
+        # Poll quickly at first and back off towards retry_delay, keeping the
+        # same overall time budget as max_retries fixed-delay attempts
         clicked = False
-        for attempt in range(max_retries):
+        delays = backoff_delays(time.monotonic() + (max_retries - 1) * retry_delay, cap=retry_delay)
+        attempt = 0
+        while True:
+            attempt += 1
             if click_template_if_found(template_path, threshold, click_delay, double_click):
                 click_type = "double-clicked" if double_click else "clicked"
                 logger.info(f"Step {i}/{len(click_steps)}: {click_type} {template_file}")
                 clicked = True
                 break
 
-            if attempt < max_retries - 1:
-                logger.debug(f"Attempt {attempt + 1}/{max_retries} failed, retrying...")
-                time.sleep(retry_delay)
+            delay = next(delays, None)
+            if delay is None:
+                break
+            logger.debug(f"Attempt {attempt} failed, retrying...")
+            time.sleep(delay)
 
         if not clicked:
-            logger.error(f"Step {i} failed: Could not find {template_file} after {max_retries} attempts")
+            logger.error(f"Step {i} failed: Could not find {template_file} after {attempt} attempts")
             sys.exit(1)
 
     logger.info(f"All {len(click_steps)} click steps completed successfully")
@@ -7,6 +7,8 @@ Windows-only: uses win32gui and ctypes for window manipulation.
 
 import sys
 import time
+import threading
+from typing import Optional
 
 if sys.platform != 'win32':
     raise ImportError("focus_window module is only available on Windows")
@@ -18,6 +20,7 @@ import win32process
 import pywintypes
 
 from utils.monitoring import get_logger
+from utils.retry import backoff_delays
 
 logger = get_logger(__name__)
 
@@ -105,27 +108,44 @@ def bring_window_to_focus(window_title_substring: str) -> bool:
             return False
 
 
-def _wait_and_focus_window(window_title: str, max_attempts: int = 10) -> bool:
+def _wait_and_focus_window(
+    window_title: str,
+    timeout: float = 20.0,
+    cancel_event: Optional[threading.Event] = None
+) -> bool:
     """
     Wait for a window to appear and bring it to focus.
 
-    Retries every 2 seconds until the window is found or max attempts reached.
+    Checks immediately, then polls with exponential backoff (50 ms growing to
+    0.5 s) so fast-starting windows are focused right away without busy-polling
+    slow ones.
 
     Args:
         window_title: Partial window title to search for.
-        max_attempts: Maximum number of attempts (default: 10).
+        timeout: Maximum time to wait in seconds (default: 20).
+        cancel_event: Optional threading.Event; when set, waiting stops immediately.
 
     Returns:
-        True if window was found and focused, False if max attempts exceeded.
+        True if window was found and focused, False if the timeout expired
+        or the wait was cancelled.
     """
     logger.info(f"Waiting for '{window_title}' window to appear...")
 
-    for attempt in range(max_attempts):
-        time.sleep(2)
+    delays = backoff_delays(time.monotonic() + timeout, cap=0.5)
+    attempt = 0
+    while True:
+        attempt += 1
         if bring_window_to_focus(window_title):
-            logger.info(f"Window focused (attempt {attempt + 1}/{max_attempts})")
+            logger.info(f"Window focused (attempt {attempt})")
             return True
-        else:
-            logger.debug(f"Window not found yet (attempt {attempt + 1}/{max_attempts})")
+        logger.debug(f"Window not found yet (attempt {attempt})")
 
-    return False
+        delay = next(delays, None)
+        if delay is None:
+            return False
+        if cancel_event:
+            if cancel_event.wait(delay):
+                logger.info(f"Stopped waiting for '{window_title}' window (cancelled)")
+                return False
+        else:
+            time.sleep(delay)
@@ -13,6 +13,29 @@ from utils.monitoring import get_logger
 
 logger = get_logger(__name__)
 
+if sys.platform == 'win32':
+    from ctypes import wintypes as _wintypes
+
+    # Private kernel32 instance so these prototypes don't leak into other
+    # modules using ctypes.windll.kernel32
+    _console_kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+    _GetStdHandle = _console_kernel32.GetStdHandle
+    _GetStdHandle.argtypes = [_wintypes.DWORD]
+    _GetStdHandle.restype = _wintypes.HANDLE
+
+    _GetConsoleMode = _console_kernel32.GetConsoleMode
+    _GetConsoleMode.argtypes = [_wintypes.HANDLE, ctypes.POINTER(_wintypes.DWORD)]
+    _GetConsoleMode.restype = _wintypes.BOOL
+
+    _SetConsoleMode = _console_kernel32.SetConsoleMode
+    _SetConsoleMode.argtypes = [_wintypes.HANDLE, _wintypes.DWORD]
+    _SetConsoleMode.restype = _wintypes.BOOL
+
+    _STD_INPUT_HANDLE = _wintypes.DWORD(-10).value
+    _ENABLE_INSERT_MODE = 0x0020
+    _ENABLE_QUICK_EDIT_MODE = 0x0040
+
 
 def disable_quickedit():
     """
@@ -28,22 +51,19 @@ def disable_quickedit():
         return
 
     try:
-        kernel32 = ctypes.windll.kernel32
-
         # Get handle to stdin
-        handle = kernel32.GetStdHandle(-10)  # STD_INPUT_HANDLE
+        handle = _GetStdHandle(_STD_INPUT_HANDLE)
 
         # Get current console mode
-        mode = ctypes.c_ulong()
-        kernel32.GetConsoleMode(handle, ctypes.byref(mode))
+        mode = _wintypes.DWORD()
+        if not _GetConsoleMode(handle, ctypes.byref(mode)):
+            return  # No console attached (e.g. started without a window)
 
-        # Disable QuickEdit (0x0040) and Insert Mode (0x0020)
-        ENABLE_QUICK_EDIT_MODE = 0x0040
-        ENABLE_INSERT_MODE = 0x0020
-        mode.value &= ~(ENABLE_QUICK_EDIT_MODE | ENABLE_INSERT_MODE)
+        # Disable QuickEdit and Insert Mode
+        mode.value &= ~(_ENABLE_QUICK_EDIT_MODE | _ENABLE_INSERT_MODE)
 
         # Set new console mode
-        kernel32.SetConsoleMode(handle, mode)
+        _SetConsoleMode(handle, mode)
     except Exception:
         pass  # Silently fail if it doesn't work
 
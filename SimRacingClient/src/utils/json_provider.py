@@ -0,0 +1,30 @@
+"""
+orjson-backed JSON provider for the Flask service.
+
+Flask's default provider encodes responses with the stdlib json module.
+OrjsonProvider swaps in orjson so jsonify() and request.json use the
+C-accelerated encoder/decoder without changing any endpoint code.
+
+Usage:
+    from utils.json_provider import OrjsonProvider
+
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+"""
+
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj, default=self.default).decode('utf-8')
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)
@@ -12,7 +12,10 @@ Usage:
     logger.error("This is an error message")
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
@@ -26,6 +29,9 @@ DEFAULT_LOG_LEVEL = logging.INFO
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Background writer used when setup_logging(use_queue=True)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 # ============================================================================
 # Logger Setup
@@ -34,7 +40,8 @@ LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 def setup_logging(
     log_level: int = DEFAULT_LOG_LEVEL,
     log_file: Optional[Path] = None,
-    console: bool = True
+    console: bool = True,
+    use_queue: bool = False
 ) -> None:
     """
     Configure the root logger with console and/or file handlers.
@@ -43,21 +50,28 @@ def setup_logging(
         log_level: Logging level (e.g., logging.INFO, logging.DEBUG)
         log_file: Optional path to log file. If None, only console logging is used.
         console: Whether to enable console logging (default: True)
+        use_queue: Write records from a background thread; logging calls only
+                   enqueue the record (default: False). Call stop_logging()
+                   to flush on shutdown (also done at exit).
     """
+    global _queue_listener
+
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
     # Clear any existing handlers
+    stop_logging()
     root_logger.handlers.clear()
 
     formatter = logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
+    handlers = []
 
     # Console handler
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(log_level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # File handler
     if log_file:
@@ -65,7 +79,42 @@ def setup_logging(
         file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if use_queue and handlers:
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+
+
+def stop_logging() -> None:
+    """
+    Stop the background log writer, if any, after flushing queued records.
+
+    The handlers are attached directly to the root logger again, so anything
+    logged afterwards is still written. Safe to call more than once or when
+    use_queue was not enabled.
+    """
+    global _queue_listener
+    listener = _queue_listener
+    if listener is not None:
+        _queue_listener = None
+        listener.stop()
+        root_logger = logging.getLogger()
+        for handler in list(root_logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                root_logger.removeHandler(handler)
+        for handler in listener.handlers:
+            root_logger.addHandler(handler)
+
+
+atexit.register(stop_logging)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -4,21 +4,30 @@ Network utilities for SimRacing client.
 Provides functions for IP address detection and mDNS service registration.
 """
 
+import asyncio
 import socket
-from typing import Dict, Any, Tuple
+import time
+from typing import Dict, Any, Tuple, Optional
 
+import psutil
 from zeroconf import ServiceInfo, Zeroconf
 
 from utils.monitoring import get_logger
 
 logger = get_logger(__name__)
 
+# Memoized result of get_local_ip() and the time it was resolved
+_CACHED_IP: Optional[str] = None
+_CACHED_IP_TS: float = 0.0
+
 
 def get_local_ip() -> str:
     """
     Get the local IP address of this machine.
 
-    Uses UDP socket method (most reliable) with hostname fallback.
+    Uses the routing table to find the address of the interface that carries
+    outbound traffic, falling back to the first active interface and then to
+    hostname resolution. Periodic callers should use get_local_ip_cached().
 
     Returns:
         Local IP address as string.
@@ -26,7 +35,7 @@ def get_local_ip() -> str:
     Raises:
         RuntimeError: If unable to determine local IP address.
     """
-    # Primary: UDP socket method - most reliable for finding the "outbound" IP
+    # Primary: UDP socket method - finds the "outbound" IP via the routing table
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(('8.8.8.8', 80))  # Google DNS - doesn't actually send packets
@@ -36,6 +45,23 @@ def get_local_ip() -> str:
     except Exception as e:
         logger.warning(f"UDP socket method failed: {e}")
 
+    # Fallback: first IPv4 address of an interface that is up, skipping
+    # loopback and link-local (APIPA) addresses. The enumeration order is not
+    # tied to routing, so this is only used when there is no default route.
+    try:
+        stats = psutil.net_if_stats()
+        for iface, addrs in psutil.net_if_addrs().items():
+            if iface in stats and not stats[iface].isup:
+                continue
+            for addr in addrs:
+                if addr.family != socket.AF_INET:
+                    continue
+                if addr.address.startswith(('127.', '169.254.')):
+                    continue
+                return addr.address
+    except Exception as e:
+        logger.warning(f"Interface enumeration failed: {e}")
+
     # Fallback: hostname resolution
     try:
         hostname = socket.gethostname()
@@ -51,6 +77,30 @@ def get_local_ip() -> str:
     )
 
 
+def get_local_ip_cached(ttl: float = 300) -> str:
+    """
+    Get the local IP address, reusing a previous lookup for up to ttl seconds.
+
+    The local IP rarely changes during the process lifetime, so periodic
+    callers should use this instead of probing the network stack each time.
+
+    Args:
+        ttl: Maximum age of the cached value in seconds (default: 300).
+
+    Returns:
+        Local IP address as string.
+
+    Raises:
+        RuntimeError: If unable to determine local IP address.
+    """
+    global _CACHED_IP, _CACHED_IP_TS
+    now = time.time()
+    if _CACHED_IP is None or now - _CACHED_IP_TS >= ttl:
+        _CACHED_IP = get_local_ip()
+        _CACHED_IP_TS = now
+    return _CACHED_IP
+
+
 def register_mdns_service(
     config: Dict[str, Any],
     port: int = 5000
@@ -65,7 +115,7 @@ def register_mdns_service(
     Returns:
         Tuple of (Zeroconf instance, ServiceInfo instance).
     """
-    local_ip = get_local_ip()
+    local_ip = get_local_ip_cached()
 
     service_type = "_simracing._tcp.local."
     service_name = f"{config['name']} SimRacing Setup.{service_type}"
@@ -88,3 +138,44 @@ def register_mdns_service(
     logger.info(f"mDNS service registered: {service_name}")
     logger.info(f"Discoverable at: {local_ip}:{port}")
     return zeroconf, info
+
+
+def update_mdns_status(
+    zeroconf: Zeroconf,
+    info: ServiceInfo,
+    status: str,
+    current_game: Optional[str] = None
+) -> ServiceInfo:
+    """
+    Re-announce the mDNS service with updated status TXT records.
+
+    Lets the orchestrator read a setup's status from its zeroconf cache
+    without polling the REST API. The announcement is scheduled on the
+    Zeroconf event loop, so this call does not block.
+
+    Args:
+        zeroconf: Zeroconf instance the service is registered with.
+        info: Currently registered ServiceInfo.
+        status: New status value.
+        current_game: Game identifier, or None if no game is configured.
+
+    Returns:
+        The new ServiceInfo (use it for later updates and unregistering).
+    """
+    properties = {
+        key.decode('utf-8'): value.decode('utf-8')
+        for key, value in info.properties.items()
+        if value is not None
+    }
+    properties['status'] = status
+    properties['current_game'] = current_game or ''
+
+    new_info = ServiceInfo(
+        info.type,
+        info.name,
+        addresses=info.addresses,
+        port=info.port,
+        properties=properties
+    )
+    asyncio.run_coroutine_threadsafe(zeroconf.async_update_service(new_info), zeroconf.loop)
+    return new_info
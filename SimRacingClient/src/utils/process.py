@@ -5,10 +5,13 @@ This module provides:
 - launch_process(): Start a game executable as a subprocess
 - launch_process_elevated(): Start a game with admin privileges (UAC prompt)
 - terminate_process(): Find and kill processes by name
+- ProcessTracker: Cheap repeated "is this game still running?" checks
 """
 
 import subprocess
 import sys
+import threading
+import time
 import psutil
 from pathlib import Path
 from typing import Optional
@@ -47,6 +50,38 @@ if sys.platform == 'win32':
     ShellExecuteEx = ctypes.windll.shell32.ShellExecuteExW
     ShellExecuteEx.restype = wintypes.BOOL
 
+    # Toolhelp process snapshot structures and constants
+    TH32CS_SNAPPROCESS = 0x00000002
+    INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", wintypes.LONG),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", wintypes.WCHAR * 260),
+        ]
+
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    CreateToolhelp32Snapshot = _kernel32.CreateToolhelp32Snapshot
+    CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    Process32FirstW = _kernel32.Process32FirstW
+    Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    Process32FirstW.restype = wintypes.BOOL
+    Process32NextW = _kernel32.Process32NextW
+    Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    Process32NextW.restype = wintypes.BOOL
+    CloseHandle = _kernel32.CloseHandle
+    CloseHandle.argtypes = [wintypes.HANDLE]
+    CloseHandle.restype = wintypes.BOOL
+
 
 def launch_process(executable_path: Path) -> subprocess.Popen:
     """
@@ -179,26 +214,155 @@ def is_running_elevated() -> bool:
         return False
 
 
-def is_process_running(process_name: str) -> bool:
+def _find_pid_toolhelp(process_name: str) -> Optional[int]:
     """
-    Check if a process with the given name is currently running.
+    Find a process ID by executable name using a Toolhelp snapshot (Windows only).
+
+    Walks the snapshot's PROCESSENTRY32 records and stops at the first match,
+    without opening a handle to every process the way a psutil scan does.
 
     Args:
-        process_name: Name of the process to check (e.g., 'F1_22.exe')
+        process_name: Name of the process to find (e.g., 'F1_22.exe')
 
     Returns:
-        bool: True if at least one process with this name is running, False otherwise
+        PID of the first match, or None if no process has this name
+
+    Raises:
+        OSError: If the snapshot cannot be created
+    """
+    snapshot = CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    try:
+        process_name_lower = process_name.lower()
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        found = Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+            if entry.szExeFile.lower() == process_name_lower:
+                return entry.th32ProcessID
+            found = Process32NextW(snapshot, ctypes.byref(entry))
+        return None
+    finally:
+        CloseHandle(snapshot)
+
+
+def find_process(process_name: str) -> Optional[psutil.Process]:
+    """
+    Find the first running process with the given name.
+
+    Uses a Toolhelp snapshot on Windows and falls back to a psutil scan
+    elsewhere (or if the snapshot fails).
+
+    Args:
+        process_name: Name of the process to find (e.g., 'F1_22.exe')
+
+    Returns:
+        psutil.Process for the first match, or None if no process has this name
     """
+    if sys.platform == 'win32':
+        try:
+            pid = _find_pid_toolhelp(process_name)
+            return psutil.Process(pid) if pid is not None else None
+        except psutil.NoSuchProcess:
+            return None  # Exited between the snapshot and the lookup
+        except (OSError, psutil.AccessDenied) as e:
+            logger.debug(f"Toolhelp lookup failed, falling back to psutil: {e}")
+
     process_name_lower = process_name.lower()
 
     for proc in psutil.process_iter(['name']):
         try:
             if proc.info['name'].lower() == process_name_lower:
-                return True
+                return proc
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
 
-    return False
+    return None
+
+
+def is_process_running(process_name: str) -> bool:
+    """
+    Check if a process with the given name is currently running.
+
+    Args:
+        process_name: Name of the process to check (e.g., 'F1_22.exe')
+
+    Returns:
+        bool: True if at least one process with this name is running, False otherwise
+    """
+    return find_process(process_name) is not None
+
+
+class ProcessTracker:
+    """
+    Tracks one named process across repeated liveness checks.
+
+    The first successful lookup remembers the matching process, so later checks
+    are a single PID query instead of a scan of the whole process table. When
+    the tracked process exits, the table is rescanned at once (the game may
+    have relaunched itself or handed off to another process with the same
+    name); only scans that keep finding nothing are throttled to one per
+    rescan_interval seconds.
+    """
+
+    def __init__(self, rescan_interval: float = 10.0):
+        self.rescan_interval = rescan_interval
+        self._lock = threading.Lock()
+        self._process_name: Optional[str] = None
+        self._process: Optional[psutil.Process] = None
+        self._last_scan = 0.0
+
+    def track(self, process_name: str) -> Optional[int]:
+        """
+        Look up a process by name now and remember it for later checks.
+
+        Call this once right after launching a game so subsequent is_running()
+        checks start from a known PID instead of waiting for the next scan.
+
+        Args:
+            process_name: Name of the process to track (e.g., 'F1_22.exe')
+
+        Returns:
+            PID of the tracked process, or None if it is not running
+        """
+        with self._lock:
+            self._process_name = process_name
+            self._last_scan = time.monotonic()
+            self._process = find_process(process_name)
+            return self._process.pid if self._process is not None else None
+
+    def is_running(self, process_name: str) -> bool:
+        """
+        Check if a process with the given name is currently running.
+
+        Args:
+            process_name: Name of the process to check (e.g., 'F1_22.exe')
+
+        Returns:
+            bool: True if the process is running, False otherwise
+        """
+        with self._lock:
+            if process_name != self._process_name:
+                # Different game: forget the old process and scan immediately
+                self._process_name = process_name
+                self._process = None
+                self._last_scan = 0.0
+
+            if self._process is not None:
+                # is_running() also compares create times, so a reused PID is not a match
+                if self._process.is_running():
+                    return True
+                self._process = None
+                self._last_scan = 0.0  # Look for a successor before reporting it gone
+
+            now = time.monotonic()
+            if now - self._last_scan < self.rescan_interval:
+                return False
+            self._last_scan = now
+            self._process = find_process(process_name)
+            return self._process is not None
 
 
 def terminate_process(process_name: str) -> bool:
@@ -0,0 +1,51 @@
+"""
+Retry pacing for polling loops.
+
+Polling loops (waiting for a window, looking for a template to click) check
+immediately, then wait between attempts. backoff_delays() yields those waits:
+short at first so fast-appearing targets are handled right away, growing
+towards a cap for slow ones, and never running past an overall deadline.
+
+Usage:
+    from utils.retry import backoff_delays
+
+    delays = backoff_delays(time.monotonic() + timeout, cap=0.5)
+    while not try_something():
+        delay = next(delays, None)
+        if delay is None:
+            break  # Deadline passed
+        time.sleep(delay)
+"""
+
+import time
+from typing import Iterator
+
+
+def backoff_delays(
+    deadline: float,
+    cap: float,
+    initial: float = 0.05,
+    factor: float = 1.5
+) -> Iterator[float]:
+    """
+    Yield exponentially growing wait times until a deadline passes.
+
+    The n-th delay is min(cap, initial * factor ** n, time left before the
+    deadline); iteration stops once the deadline has passed.
+
+    Args:
+        deadline: time.monotonic() value after which no more delays are yielded
+        cap: Longest single delay in seconds
+        initial: Base delay in seconds (default: 0.05)
+        factor: Growth factor per attempt (default: 1.5)
+
+    Yields:
+        Delay in seconds before the next attempt
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        yield min(cap, initial * factor ** attempt, remaining)
@@ -0,0 +1,105 @@
+"""
+Fast screen grabs for template matching.
+
+Wraps mss so the navigation loops get BGR numpy arrays straight from the
+raw capture buffer, without the PIL image and RGB->BGR conversion that
+pyautogui.screenshot() goes through. mss keeps per-thread device contexts,
+so each thread lazily gets its own grabber and reuses it afterwards.
+Call close_grabber() when a thread is done grabbing to release its handles.
+
+Usage:
+    from utils.screen_capture import grab_region, grab_screen
+
+    screen = grab_screen()                    # Whole primary monitor
+    region = grab_region(100, 200, 320, 180)  # left, top, width, height
+    left, top, width, height = virtual_screen_bounds()
+"""
+
+import sys
+import threading
+
+import numpy as np
+from mss import mss
+
+_local = threading.local()
+
+if sys.platform == 'win32':
+    import ctypes
+
+    # Private user32 instance so no prototypes leak into other ctypes users
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+
+def _grabber():
+    """Return this thread's mss instance, creating it on first use."""
+    sct = getattr(_local, "sct", None)
+    if sct is None:
+        sct = _local.sct = mss()
+    return sct
+
+
+def close_grabber() -> None:
+    """
+    Release this thread's mss instance, if it has one.
+
+    Safe to call when the thread never grabbed; a later grab on the same
+    thread simply creates a new instance.
+    """
+    sct = getattr(_local, "sct", None)
+    if sct is not None:
+        _local.sct = None
+        sct.close()
+
+
+def _to_bgr(screenshot) -> np.ndarray:
+    """View an mss screenshot as a BGR array without copying the pixels."""
+    bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 4)
+    return bgra[:, :, :3]
+
+
+def grab_region(left: int, top: int, width: int, height: int) -> np.ndarray:
+    """
+    Capture a screen region as a BGR image.
+
+    Coordinates are in screen pixels, the same space as pyautogui.position().
+    The returned array is a read-only, non-contiguous view; copy it before
+    modifying it.
+
+    Args:
+        left: X coordinate of the region's top-left corner
+        top: Y coordinate of the region's top-left corner
+        width: Region width in pixels
+        height: Region height in pixels
+
+    Returns:
+        BGR image of shape (height, width, 3)
+    """
+    return _to_bgr(_grabber().grab({"left": left, "top": top, "width": width, "height": height}))
+
+
+def grab_screen() -> np.ndarray:
+    """
+    Capture the whole primary monitor as a BGR image.
+
+    Returns:
+        BGR image of the primary monitor (see grab_region for caveats)
+    """
+    sct = _grabber()
+    return _to_bgr(sct.grab(sct.monitors[1]))
+
+
+def virtual_screen_bounds() -> tuple:
+    """
+    Get the bounds of the desktop spanning all monitors.
+
+    Coordinates are in screen pixels; left/top are negative when a monitor
+    sits left of or above the primary one.
+
+    Returns:
+        Tuple of (left, top, width, height)
+    """
+    if sys.platform == 'win32':
+        # SM_XVIRTUALSCREEN, SM_YVIRTUALSCREEN, SM_CXVIRTUALSCREEN, SM_CYVIRTUALSCREEN
+        return tuple(_user32.GetSystemMetrics(index) for index in (76, 77, 78, 79))
+    desktop = _grabber().monitors[0]
+    return desktop["left"], desktop["top"], desktop["width"], desktop["height"]
@@ -1,5 +1,4 @@
 import cv2
-import numpy as np
 import pyautogui
 from typing import Callable, List, Union, Tuple, Optional
 import time
@@ -9,6 +8,8 @@ import json
 from pathlib import Path
 from utils.monitoring import get_logger
 from utils.data_model import NavigationConfig, Step, StepOption
+from utils.template_cache import load_template, prewarm_templates
+from utils.screen_capture import close_grabber, grab_region
 
 logger = get_logger(__name__)
 
@@ -97,10 +98,8 @@ def match_template_at_position(
     absolute_x = int(relative_x * screen_width)
     absolute_y = int(relative_y * screen_height)
 
-    # Load template image
-    template = cv2.imread(template_path, cv2.IMREAD_COLOR)
-    if template is None:
-        raise ValueError(f"Could not load template image from {template_path}")
+    # Load template image (decoded once, then served from the cache)
+    template = load_template(template_path)
 
     template_height, template_width = template.shape[:2]
 
@@ -115,8 +114,7 @@ def match_template_at_position(
     capture_height = min(template_height + 2 * margin_y, screen_height - capture_y)
 
     # Capture screenshot of the region
-    screenshot = pyautogui.screenshot(region=(capture_x, capture_y, capture_width, capture_height))
-    screenshot_np = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+    screenshot_np = grab_region(capture_x, capture_y, capture_width, capture_height)
 
     # Ensure screenshot is large enough for template matching
     if screenshot_np.shape[0] < template_height or screenshot_np.shape[1] < template_width:
@@ -577,6 +575,34 @@ def navigate_press_until_match(
     logger.info(f"Failed to match {template_path} after pressing, accuracy = {max_val}")
     return False  # Keep trying
 
+def prewarm_navigation_templates(nav_configs: List[NavigationConfig], template_base_dir: str) -> int:
+    """
+    Decode every template referenced by the given navigation configs into the template cache.
+
+    Paths are built exactly as attempt_step_options builds them, so the
+    cached entries are hit during navigation.
+
+    Args:
+        nav_configs: Navigation configs whose sequences are already resolved
+        template_base_dir: Base directory for resolving relative template paths
+
+    Returns:
+        Number of templates loaded
+    """
+    template_paths = []
+    for nav_config in nav_configs:
+        if nav_config.navigation_sequence is None:
+            continue
+        template_dir = str(Path(template_base_dir) / nav_config.template_dir)
+        for step in nav_config.navigation_sequence.steps:
+            for option in step.options:
+                template_paths.append(f"{template_dir}/{option.template}")
+
+    loaded = prewarm_templates(template_paths)
+    logger.debug(f"Prewarmed {loaded}/{len(template_paths)} navigation templates")
+    return loaded
+
+
 def load_and_execute_navigation(
     nav_config: NavigationConfig,
     template_base_dir: str,
@@ -650,7 +676,8 @@ def load_and_execute_navigation(
     logger.debug(f"  Threshold: {nav_config.template_threshold}, Max retries: {nav_config.max_retries}")
     logger.debug(f"  Search margin: {nav_config.search_margin}, Method: {nav_config.matching_method}")
 
-    success = execute_navigation_sequence(
+    try:
+        success = execute_navigation_sequence(
             steps=sequence.steps,
             template_dir=template_dir,
             threshold=nav_config.template_threshold,
@@ -662,6 +689,9 @@ def load_and_execute_navigation(
             cancel_event=cancel_event,
             context=context
         )
+    finally:
+        # Navigation runs on pooled threads; don't keep their screen DCs alive
+        close_grabber()
 
     if not success:
         logger.error(f"✗ Navigation failed")
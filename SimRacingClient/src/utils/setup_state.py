@@ -6,7 +6,8 @@ related to game configuration and execution status.
 """
 
 import threading
-from typing import Optional, Literal
+from dataclasses import dataclass, replace
+from typing import Callable, Optional, Literal
 
 from utils.monitoring import get_logger
 
@@ -16,13 +17,31 @@ logger = get_logger(__name__)
 Status = Literal["idle", "configured", "starting", "running"]
 
 
+@dataclass(frozen=True, slots=True)
+class State:
+    """Immutable view of the setup state at one point in time."""
+    status: Status = "idle"
+    current_game: Optional[str] = None
+    session_id: Optional[str] = None
+    role: Optional[str] = None
+    player_count: Optional[int] = None
+    host_ip: Optional[str] = None
+    process_name: Optional[str] = None
+
+
+# Shared idle state; frozen, so every reset can reuse it
+IDLE_STATE = State()
+
+
 class SetupState:
     """
     Thread-safe state management for the SimRacing client.
 
     Encapsulates all state related to game configuration and execution,
     providing thread-safe access methods for use across multiple threads
-    (HTTP handlers, heartbeat thread, game launch thread).
+    (HTTP handlers, heartbeat thread, game launch thread). The fields live in
+    an immutable State that is replaced on every transition, so reads never
+    take the lock and never observe a half-applied update.
 
     Attributes:
         status: Current state ("idle", "configured", "starting", "running")
@@ -31,6 +50,9 @@ class SetupState:
         role: Player role ("host", "join", "singleplayer")
         player_count: Number of players in session
         host_ip: IP address of the host (for join role)
+        process_name: Process name of the configured game (resolved at configure time)
+        on_change: Optional callback invoked with a snapshot after every
+                   state transition (called outside the lock)
 
     Example:
         state = SetupState()
@@ -41,74 +63,94 @@ class SetupState:
     """
 
     def __init__(self):
+        # Writers build a new State under the lock and swap the reference;
+        # readers just load self._state, which is always a consistent object
         self._lock = threading.Lock()
-        self._status: Status = "idle"
-        self._current_game: Optional[str] = None
-        self._session_id: Optional[str] = None
-        self._role: Optional[str] = None
-        self._player_count: Optional[int] = None
-        self._host_ip: Optional[str] = None
+        self._state: State = IDLE_STATE
+        self.on_change: Optional[Callable[[dict], None]] = None
 
     # -------------------------------------------------------------------------
-    # Thread-safe property access
+    # Lock-free property access
     # -------------------------------------------------------------------------
 
     @property
     def status(self) -> Status:
-        """Get current status (thread-safe)."""
-        with self._lock:
-            return self._status
+        """Get current status."""
+        return self._state.status
 
     @property
     def current_game(self) -> Optional[str]:
-        """Get current game identifier (thread-safe)."""
-        with self._lock:
-            return self._current_game
+        """Get current game identifier."""
+        return self._state.current_game
 
     @property
     def session_id(self) -> Optional[str]:
-        """Get current session ID (thread-safe)."""
-        with self._lock:
-            return self._session_id
+        """Get current session ID."""
+        return self._state.session_id
 
     @property
     def role(self) -> Optional[str]:
-        """Get current role (thread-safe)."""
-        with self._lock:
-            return self._role
+        """Get current role."""
+        return self._state.role
 
     @property
     def player_count(self) -> Optional[int]:
-        """Get player count (thread-safe)."""
-        with self._lock:
-            return self._player_count
+        """Get player count."""
+        return self._state.player_count
 
     @property
     def host_ip(self) -> Optional[str]:
-        """Get host IP address (thread-safe)."""
-        with self._lock:
-            return self._host_ip
+        """Get host IP address."""
+        return self._state.host_ip
+
+    @property
+    def process_name(self) -> Optional[str]:
+        """Get the configured game's process name."""
+        return self._state.process_name
 
     # -------------------------------------------------------------------------
     # State operations
     # -------------------------------------------------------------------------
 
+    def current(self) -> State:
+        """
+        Get the current immutable state.
+
+        Read several fields from the returned object instead of through the
+        individual properties to see them all from the same transition.
+
+        Returns:
+            The current State.
+        """
+        return self._state
+
     def snapshot(self) -> dict:
         """
-        Get a thread-safe copy of the complete state.
+        Get a copy of the complete state as a dictionary.
 
         Returns:
             Dictionary containing all state fields.
         """
-        with self._lock:
-            return {
-                "status": self._status,
-                "current_game": self._current_game,
-                "session_id": self._session_id,
-                "role": self._role,
-                "player_count": self._player_count,
-                "host_ip": self._host_ip
-            }
+        state = self._state
+        return {
+            "status": state.status,
+            "current_game": state.current_game,
+            "session_id": state.session_id,
+            "role": state.role,
+            "player_count": state.player_count,
+            "host_ip": state.host_ip,
+            "process_name": state.process_name
+        }
+
+    def _notify(self) -> None:
+        """Invoke the on_change callback with the current state, if set."""
+        callback = self.on_change
+        if callback is None:
+            return
+        try:
+            callback(self.snapshot())
+        except Exception as e:
+            logger.error(f"State change callback failed: {e}")
 
     def configure(
         self,
@@ -116,7 +158,8 @@ class SetupState:
         session_id: str,
         role: str,
         player_count: Optional[int] = None,
-        host_ip: Optional[str] = None
+        host_ip: Optional[str] = None,
+        process_name: Optional[str] = None
     ) -> None:
         """
         Configure the setup for a game session.
@@ -129,19 +172,25 @@ class SetupState:
             role: Player role ("host", "join", "singleplayer")
             player_count: Optional number of players in session
             host_ip: Optional host IP address (required for "join" role)
+            process_name: Optional process name of the game, so later checks
+                          don't need a registry lookup
         """
         with self._lock:
-            self._current_game = game
-            self._session_id = session_id
-            self._role = role
-            self._player_count = player_count
-            self._host_ip = host_ip
-            self._status = "configured"
+            self._state = State(
+                status="configured",
+                current_game=game,
+                session_id=session_id,
+                role=role,
+                player_count=player_count,
+                host_ip=host_ip,
+                process_name=process_name
+            )
 
         logger.info(
             f"State configured: Game={game}, Session={session_id}, "
             f"Role={role}, PlayerCount={player_count}, HostIP={host_ip}"
         )
+        self._notify()
 
     def set_status(self, status: Status) -> None:
         """
@@ -151,11 +200,13 @@ class SetupState:
             status: New status value
         """
         with self._lock:
-            old_status = self._status
-            self._status = status
+            old_status = self._state.status
+            if old_status != status:
+                self._state = replace(self._state, status=status)
 
         if old_status != status:
             logger.debug(f"State status changed: {old_status} -> {status}")
+            self._notify()
 
     def reset(self) -> None:
         """
@@ -164,34 +215,27 @@ class SetupState:
         Clears all configuration and sets status back to "idle".
         """
         with self._lock:
-            self._status = "idle"
-            self._current_game = None
-            self._session_id = None
-            self._role = None
-            self._player_count = None
-            self._host_ip = None
+            self._state = IDLE_STATE
 
         logger.debug("State reset to idle")
+        self._notify()
 
     def is_configured(self) -> bool:
-        """Check if setup is in configured state (thread-safe)."""
-        with self._lock:
-            return self._status == "configured"
+        """Check if setup is in configured state."""
+        return self._state.status == "configured"
 
     def is_running(self) -> bool:
-        """Check if a game is currently running (thread-safe)."""
-        with self._lock:
-            return self._status == "running"
+        """Check if a game is currently running."""
+        return self._state.status == "running"
 
     def is_idle(self) -> bool:
-        """Check if setup is idle (thread-safe)."""
-        with self._lock:
-            return self._status == "idle"
+        """Check if setup is idle."""
+        return self._state.status == "idle"
 
     def __repr__(self) -> str:
         """String representation for debugging."""
-        with self._lock:
-            return (
-                f"SetupState(status={self._status!r}, "
-                f"game={self._current_game!r}, role={self._role!r})"
-            )
+        state = self._state
+        return (
+            f"SetupState(status={state.status!r}, "
+            f"game={state.current_game!r}, role={state.role!r})"
+        )
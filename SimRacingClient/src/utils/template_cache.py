@@ -0,0 +1,79 @@
+"""
+In-memory cache of decoded template images.
+
+Navigation and click steps poll the same template many times per second
+while waiting for a screen to appear. load_template() decodes each image
+file once and hands out the cached array until the file changes on disk
+(e.g. after a template is re-captured), and prewarm_templates()
+lets callers decode a whole sequence's templates ahead of time (e.g. while
+the game window is still starting).
+
+Usage:
+    from utils.template_cache import load_template, prewarm_templates
+
+    template = load_template("/path/to/templates/F1_22/menu.png")
+"""
+
+import os
+from functools import lru_cache
+from typing import Iterable
+
+import cv2
+import numpy as np
+
+from utils.monitoring import get_logger
+
+logger = get_logger(__name__)
+
+
+@lru_cache(maxsize=256)
+def _decode_template(template_path: str, mtime_ns: int) -> np.ndarray:
+    """Decode a template image; mtime_ns only keys the cache entry."""
+    template = cv2.imread(template_path, cv2.IMREAD_COLOR)
+    if template is None:
+        raise ValueError(f"Could not load template image from {template_path}")
+    return template
+
+
+def load_template(template_path: str) -> np.ndarray:
+    """
+    Load a template image as BGR, decoding each version of a file only once.
+
+    Cache entries are keyed by path and modification time, so a template
+    edited or re-captured on disk is decoded again on its next use.
+    The returned array is shared between callers and must not be modified.
+
+    Args:
+        template_path: Path to the template image file
+
+    Returns:
+        The decoded template image
+
+    Raises:
+        ValueError: If the template image cannot be loaded (not cached)
+    """
+    try:
+        mtime_ns = os.stat(template_path).st_mtime_ns
+    except OSError:
+        raise ValueError(f"Could not load template image from {template_path}") from None
+    return _decode_template(template_path, mtime_ns)
+
+
+def prewarm_templates(template_paths: Iterable[str]) -> int:
+    """
+    Decode templates into the cache ahead of their first use.
+
+    Args:
+        template_paths: Paths of the template images to load
+
+    Returns:
+        Number of templates loaded successfully
+    """
+    loaded = 0
+    for template_path in template_paths:
+        try:
+            load_template(template_path)
+            loaded += 1
+        except ValueError as e:
+            logger.warning(f"Template prewarm skipped: {e}")
+    return loaded
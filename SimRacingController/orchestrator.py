@@ -3,11 +3,20 @@ SimRacing Orchestrator - Web Interface Only
 Refactored version without global variables - all state encapsulated in classes
 """
 from typing import Dict, Optional, List
-from flask import Flask, request, jsonify, send_from_directory
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, Response, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+from waitress import serve
 from zeroconf import ServiceBrowser, ServiceListener, Zeroconf
+from zeroconf.asyncio import AsyncServiceInfo
+from cachetools import TTLCache
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import socket
+import asyncio
 import sys
 from pydantic import BaseModel
 import logging
@@ -89,12 +98,40 @@ SLOTS: Dict[int, Slot] = {
     4: Slot(slot_number=4)
 }
 
+# Response keys for /api/setups, built once instead of per request
+SLOT_KEYS: Dict[int, str] = {slot_num: f"slot_{slot_num}" for slot_num in SLOTS}
+
 # Map of setup_id to slot_number for quick lookup
 SETUP_TO_SLOT: Dict[str, int] = {}
 
 # Global reference to service listener
 service_browser_listener = None
 
+# Shared HTTP session so repeated calls to the same setup reuse keep-alive
+# connections instead of opening a new TCP connection per request
+http_session = requests.Session()
+# Retry transient failures with backoff. Connection errors are retried for every
+# method since the request never reached the setup. Read retries stay off and
+# status retries are limited to GET: a POST that reached the setup (e.g.
+# /api/start) and then timed out or got a 503 must not be sent a second time
+http_retry = Retry(
+    total=3,
+    connect=3,
+    read=0,
+    status=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({'GET'}),
+    raise_on_status=False
+)
+http_session.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=http_retry))
+
+# Request bodies are pre-serialized with orjson and sent with this header
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Constant heartbeat reply when every slot is taken, serialized once
+NO_SLOT_BODY = orjson.dumps({"status": "no_slot_available"})
+
 port = 8000
 
 
@@ -124,16 +161,31 @@ def get_local_ip():
     )
 
 
+_cached_ip = None
+_cached_ip_ts = 0.0
+
+
+def get_local_ip_cached(ttl=300):
+    """Return get_local_ip(), reusing the previous lookup for up to ttl seconds"""
+    global _cached_ip, _cached_ip_ts
+    now = time.time()
+    if _cached_ip is None or now - _cached_ip_ts >= ttl:
+        _cached_ip = get_local_ip()
+        _cached_ip_ts = now
+    return _cached_ip
+
+
 def auto_register_setup(address, setup_port):
     """Automatically register with a discovered setup"""
-    orchestrator_url = f"http://{get_local_ip()}:{port}"
+    orchestrator_url = f"http://{get_local_ip_cached()}:{port}"
     setup_url = f"http://{address}:{setup_port}"
     
     try:
         logger.info(f"Auto-registering with setup at {setup_url}")
-        response = requests.post(
+        response = http_session.post(
             f"{setup_url}/api/register_orchestrator",
-            json={"orchestrator_url": orchestrator_url},
+            data=orjson.dumps({"orchestrator_url": orchestrator_url}),
+            headers=JSON_HEADERS,
             timeout=5
         )
         response.raise_for_status()
@@ -177,48 +229,81 @@ def assign_setup_to_slot(setup_id: str, setup: SetupRegistration) -> Optional[in
 
 
 class SetupListener(ServiceListener):
+    # Seconds a discovered setup is kept without an mDNS announcement or heartbeat
+    DISCOVERY_TTL = 60
+    # TXT fields the orchestrator reads, paired with their encoded lookup key
+    TXT_FIELDS = tuple((key, key.encode('utf-8')) for key in ('name', 'id', 'status', 'current_game'))
+
     def __init__(self):
-        self.discovered_setups = {}  # Track discovered setups before they have heartbeats
+        # Track discovered setups before they have heartbeats; entries expire unless
+        # refreshed so stale addresses don't accumulate (TTLCache is not thread-safe)
+        self.discovered_setups = TTLCache(maxsize=256, ttl=self.DISCOVERY_TTL)
+        self._lock = threading.Lock()
+        # Blocking follow-up work (auto-registration HTTP calls) runs on this pool
+        # so neither the browser thread nor the zeroconf event loop is held up
+        self._resolver = ThreadPoolExecutor(max_workers=8, thread_name_prefix='mdns-resolve')
 
     def add_service(self, zc, type_, name):
-        info = zc.get_service_info(type_, name)
-        if info:
+        self._request_info(zc, type_, name, self._on_service_resolved)
+
+    def _request_info(self, zc, type_, name, callback):
+        # Resolve SRV/TXT records on zeroconf's own event loop so lookups for
+        # several setups overlap instead of each blocking for the full timeout
+        info = AsyncServiceInfo(type_, name)
+        future = asyncio.run_coroutine_threadsafe(info.async_request(zc, 3000), zc.loop)
+        future.add_done_callback(
+            lambda f: self._resolver.submit(callback, name, info, f)
+        )
+
+    @classmethod
+    def _decode_properties(cls, info):
+        """Decode only the TXT fields the orchestrator reads, leaving the rest as raw bytes"""
+        raw = info.properties
+        properties = {}
+        for key, raw_key in cls.TXT_FIELDS:
+            value = raw.get(raw_key)
+            if value:
+                properties[key] = value.decode('utf-8')
+        return properties
+
+    def _on_service_resolved(self, name, info, future):
+        """Store a resolved setup and auto-register with it (runs on the resolver pool)"""
+        if future.exception():
+            logger.error(f"Failed to resolve {name}: {future.exception()}")
+            return
+        if future.result():
             address = socket.inet_ntoa(info.addresses[0])
             setup_port = info.port
             if not setup_port:
-                raise ValueError(f"Could not find a port in {info}")
-            properties = {}
-            for key, value in info.properties.items():
-                if value:
-                    properties[key.decode('utf-8')] = value.decode('utf-8')
+                logger.error(f"Could not find a port in {info}")
+                return
+            properties = self._decode_properties(info)
 
             setup_id = f"{address}:{setup_port}"
 
             # Store discovered setup temporarily
-            self.discovered_setups[setup_id] = SetupRegistration(
-                name = name,
-                address = address,
-                port = setup_port,
-                properties = properties
-            )
+            with self._lock:
+                self.discovered_setups[setup_id] = SetupRegistration(
+                    name = name,
+                    address = address,
+                    port = setup_port,
+                    properties = properties
+                )
 
             logger.info(f"[+] Discovered setup: {properties.get('name', 'Unknown')} at {address}:{setup_port}")
 
-            threading.Thread(
-                target=auto_register_setup,
-                args=(address, setup_port),
-                daemon=True
-            ).start()
+            auto_register_setup(address, setup_port)
 
     def remove_service(self, zc, type_, name):
         logger.info(f"[-] Setup disconnected: {name}")
 
         # Find and remove from slots
         setup_to_remove = None
-        for setup_id, setup_info in self.discovered_setups.items():
-            if setup_info.name == name:
-                setup_to_remove = setup_id
-                break
+        with self._lock:
+            for setup_id, setup_info in self.discovered_setups.items():
+                if setup_info.name == name:
+                    setup_to_remove = setup_id
+                    break
 
         if setup_to_remove:
             # Remove from slot if assigned
@@ -229,13 +314,67 @@ class SetupListener(ServiceListener):
                 logger.info(f"Removed {setup_to_remove} from Slot {slot_num}")
 
             # Remove from discovered setups
-            del self.discovered_setups[setup_to_remove]
+            with self._lock:
+                self.discovered_setups.pop(setup_to_remove, None)
 
     def update_service(self, zc, type_, name):
-        pass
+        # Setups re-announce their TXT records on every state transition
+        self._request_info(zc, type_, name, self._on_service_updated)
+
+    def _on_service_updated(self, name, info, future):
+        """Refresh or re-insert a setup from its new TXT records (runs on the resolver pool)"""
+        if future.exception() or not future.result() or not info.addresses or not info.port:
+            return
+        address = socket.inet_ntoa(info.addresses[0])
+        setup_id = f"{address}:{info.port}"
+        properties = self._decode_properties(info)
+        with self._lock:
+            setup = self.discovered_setups.get(setup_id)
+            rediscovered = setup is None
+            if rediscovered:
+                # The entry expired (e.g. no heartbeat during a network hiccup);
+                # zeroconf won't call add_service again for a known name
+                setup = SetupRegistration(
+                    name = name,
+                    address = address,
+                    port = info.port,
+                    properties = properties
+                )
+            else:
+                setup.properties = properties
+            self.discovered_setups[setup_id] = setup
+
+        if rediscovered:
+            logger.info(f"[+] Rediscovered setup: {properties.get('name', 'Unknown')} at {setup_id}")
+            auto_register_setup(address, info.port)
+        else:
+            logger.info(f"[~] Setup updated: {setup_id} status={properties.get('status')}")
+
+    def get_setup(self, setup_id):
+        """Get a discovered setup, refreshing its expiry time"""
+        with self._lock:
+            setup = self.discovered_setups.get(setup_id)
+            if setup is not None:
+                self.discovered_setups[setup_id] = setup
+            return setup
+
+    def close(self):
+        """Stop resolving newly discovered services"""
+        self._resolver.shutdown(wait=False)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson instead of the stdlib json module"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 
 app = Flask(__name__, static_folder='static')
+app.json = OrjsonProvider(app)
 
 
 @app.route('/')
@@ -247,7 +386,9 @@ def index():
 @app.route('/api/heartbeat', methods=['POST'])
 def receive_heartbeat():
     """Receive heartbeat updates from setups and assign to slots"""
-    data = request.json
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Invalid heartbeat payload"}), 400
 
     heartbeat_port = data.get('port', 5000)
     setup_id = f"{data.get('ip')}:{heartbeat_port}"
@@ -270,17 +411,17 @@ def receive_heartbeat():
         slot_num = SETUP_TO_SLOT[setup_id]
         if SLOTS[slot_num].setup is not None:
             SLOTS[slot_num].setup.heartbeat = heartbeat  # type: ignore
+        # Keep the mDNS entry alive so remove_service can still find it
+        if service_browser_listener:
+            service_browser_listener.get_setup(setup_id)
     else:
         # New setup or setup without slot assignment
         # Try to find it in discovered setups (from mDNS)
-        setup = None
-        for listener in [service_browser_listener]:  # We'll need to track this
-            if hasattr(listener, 'discovered_setups') and setup_id in listener.discovered_setups:   # type: ignore
-                setup = listener.discovered_setups[setup_id]  # type: ignore
-                setup.heartbeat = heartbeat
-                # Assign to slot based on machine ID
-                slot_num = assign_setup_to_slot(setup_id, setup)
-                break
+        setup = service_browser_listener.get_setup(setup_id) if service_browser_listener else None
+        if setup:
+            setup.heartbeat = heartbeat
+            # Assign to slot based on machine ID
+            slot_num = assign_setup_to_slot(setup_id, setup)
 
         if not setup:
             # Heartbeat from unknown setup (not discovered via mDNS)
@@ -297,40 +438,55 @@ def receive_heartbeat():
 
     if slot_num:
         logger.info(f"Heartbeat from {setup_id} (Slot {slot_num})")
-        return jsonify({"status": "received", "slot": slot_num})
+        return Response(orjson.dumps({"status": "received", "slot": slot_num}), mimetype='application/json')
     else:
         logger.warning(f"Could not assign {setup_id} to a slot")
-        return jsonify({"status": "no_slot_available"}), 503
+        return Response(NO_SLOT_BODY, status=503, mimetype='application/json')
 
 
 @app.route('/api/setups', methods=['GET'])
 def get_setups():
     """Get all 4 slots with their current setups"""
     result = {}
+    summary = []
 
     for slot_num, slot in SLOTS.items():
+        # Evaluate once per slot; reused for the response and the log summary
+        online = slot.is_online()
         slot_data = {
             "slot_number": slot_num,
-            "online": slot.is_online(),
+            "online": online,
             "setup": None
         }
 
         if slot.setup:
             setup = slot.setup
-            slot_data["setup"] = {
-                "address": setup.address,
-                "port": setup.port,
-                "name": setup.heartbeat.name if setup.heartbeat else setup.properties.get('name', 'Unknown'),
-                "status": setup.heartbeat.status if setup.heartbeat else 'unknown',
-                "current_game": setup.heartbeat.current_game if setup.heartbeat else None,
-                "session_id": setup.heartbeat.session_id if setup.heartbeat else None,
-                "last_seen": setup.heartbeat.last_seen if setup.heartbeat else None
-            }
+            heartbeat = setup.heartbeat
+            if heartbeat:
+                slot_data["setup"] = {
+                    "address": setup.address,
+                    "port": setup.port,
+                    "name": heartbeat.name,
+                    "status": heartbeat.status,
+                    "current_game": heartbeat.current_game,
+                    "session_id": heartbeat.session_id,
+                    "last_seen": heartbeat.last_seen
+                }
+            else:
+                slot_data["setup"] = {
+                    "address": setup.address,
+                    "port": setup.port,
+                    "name": setup.properties.get('name', 'Unknown'),
+                    "status": setup.properties.get('status', 'unknown'),
+                    "current_game": None,
+                    "session_id": None,
+                    "last_seen": None
+                }
 
-        result[f"slot_{slot_num}"] = slot_data
+        result[SLOT_KEYS[slot_num]] = slot_data
+        summary.append(f"Slot {slot_num}: {'online' if online else 'offline'}")
 
-    logger.info(f"Status request | Slot summary: " +
-                " | ".join([f"Slot {i}: {'online' if SLOTS[i].is_online() else 'offline'}" for i in range(1, 5)]))
+    logger.info("Status request | Slot summary: %s", " | ".join(summary))
 
     return jsonify(result)
 
@@ -338,7 +494,7 @@ def get_setups():
 @app.route('/api/start_slot', methods=['POST'])
 def start_slot():
     """Start game on a specific slot"""
-    data = request.json
+    data = request.get_json(silent=True) or {}
     slot_number = data.get('slot')
     game = data.get('game')
     mode = data.get('mode', 'singleplayer')  # 'singleplayer' or 'multiplayer'
@@ -362,13 +518,14 @@ def start_slot():
         logger.info(f"Starting {game} ({mode}) on Slot {slot_number}")
 
         # Phase 1: Configure
-        config_response = requests.post(
+        config_response = http_session.post(
             f"http://{setup_id}/api/configure",
-            json={
+            data=orjson.dumps({
                 "game": game,
                 "session_id": session_id,
                 "role": role
-            },
+            }),
+            headers=JSON_HEADERS,
             timeout=5
         )
 
@@ -377,7 +534,7 @@ def start_slot():
             return jsonify({"error": "Configuration failed", "details": config_response.text}), 500
 
         # Phase 2: Start
-        start_response = requests.post(
+        start_response = http_session.post(
             f"http://{setup_id}/api/start",
             timeout=5
         )
@@ -402,7 +559,7 @@ def start_slot():
 @app.route('/api/stop_slot', methods=['POST'])
 def stop_slot():
     """Stop game on a specific slot"""
-    data = request.json
+    data = request.get_json(silent=True) or {}
     slot_number = data.get('slot')
 
     if not slot_number:
@@ -421,7 +578,7 @@ def stop_slot():
     try:
         logger.info(f"Stopping game on Slot {slot_number}")
 
-        stop_response = requests.post(
+        stop_response = http_session.post(
             f"http://{setup_id}/api/stop",
             timeout=5
         )
@@ -444,7 +601,7 @@ def stop_slot():
 @app.route('/api/start_multiplayer', methods=['POST'])
 def start_multiplayer():
     """Start F1 22 multiplayer on selected slots"""
-    data = request.json
+    data = request.get_json(silent=True) or {}
     slot_numbers = data.get('slots', [])
     game = data.get('game', 'f1_22')
 
@@ -467,49 +624,59 @@ def start_multiplayer():
     host_ip = host_slot.setup.address if host_slot.setup else None
     logger.info(f"Host IP for this session: {host_ip}")
 
-    # Phase 1: Configure all slots
+    # Phase 1: Configure all slots (concurrently, so total time is ~one round trip)
     logger.info(f"Phase 1: Configuring {len(slot_numbers)} slots for {game} multiplayer")
-    for i, slot_num in enumerate(slot_numbers):
-        slot = SLOTS[slot_num]
-        setup_id = slot.get_setup_id()
+
+    def configure_slot(i, slot_num):
+        """Configure one slot; returns (setup_id, role, error result or None)"""
+        setup_id = SLOTS[slot_num].get_setup_id()
         role = "host" if i == 0 else "join"
 
         try:
             logger.info(f"Configuring Slot {slot_num} as {role}")
 
-            config_response = requests.post(
+            config_response = http_session.post(
                 f"http://{setup_id}/api/configure",
-                json={
+                data=orjson.dumps({
                     "game": game,
                     "session_id": session_id,
                     "role": role,
                     "player_count": len(slot_numbers),
                     "host_ip": host_ip
-                },
+                }),
+                headers=JSON_HEADERS,
                 timeout=5
             )
 
             if not config_response.ok:
                 logger.error(f"Failed to configure Slot {slot_num}: {config_response.text}")
-                results.append({
+                return setup_id, role, {
                     "slot": slot_num,
                     "role": role,
                     "status": "failed_configure",
                     "error": config_response.text
-                })
-                continue
+                }
 
             logger.info(f"✓ Configuration confirmed for Slot {slot_num}")
-            configured_slots.append((slot_num, setup_id, role))
+            return setup_id, role, None
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error configuring Slot {slot_num}: {e}")
-            results.append({
+            return setup_id, role, {
                 "slot": slot_num,
                 "role": role,
                 "status": "error_configure",
                 "error": str(e)
-            })
+            }
+
+    with ThreadPoolExecutor(max_workers=min(16, len(slot_numbers))) as executor:
+        outcomes = list(executor.map(configure_slot, range(len(slot_numbers)), slot_numbers))
+
+    for slot_num, (setup_id, role, error_result) in zip(slot_numbers, outcomes):
+        if error_result:
+            results.append(error_result)
+        else:
+            configured_slots.append((slot_num, setup_id, role))
 
     # Check if all slots were configured
     if len(configured_slots) < len(slot_numbers):
@@ -529,7 +696,7 @@ def start_multiplayer():
         try:
             logger.info(f"Starting game on Slot {slot_num}")
 
-            start_response = requests.post(
+            start_response = http_session.post(
                 f"http://{setup_id}/api/start",
                 timeout=5
             )
@@ -573,47 +740,51 @@ def start_multiplayer():
 @app.route('/api/configure_motion', methods=['POST'])
 def configure_motion():
     """Configure motion/wheel software on all online setups"""
-    results = []
-
-    for slot_num, slot in SLOTS.items():
-        if not slot.is_online():
-            continue
 
+    def configure_slot(slot_num, slot):
+        """Run the Cammus configuration on one setup and return its result entry"""
         setup_id = slot.get_setup_id()
         setup_name = slot.setup.heartbeat.name if slot.setup and slot.setup.heartbeat else f"Slot {slot_num}"
 
         try:
             logger.info(f"Configuring motion on {setup_name} ({setup_id})")
 
-            response = requests.post(
+            response = http_session.post(
                 f"http://{setup_id}/api/configure_cammus",
                 timeout=60  # Longer timeout as this can take a while
             )
 
             if response.ok:
                 logger.info(f"✓ Motion configured on {setup_name}")
-                results.append({
+                return {
                     "slot": slot_num,
                     "name": setup_name,
                     "status": "success"
-                })
+                }
             else:
                 logger.error(f"Failed to configure motion on {setup_name}: {response.text}")
-                results.append({
+                return {
                     "slot": slot_num,
                     "name": setup_name,
                     "status": "failed",
-                    "error": response.json().get('message', response.text)
-                })
+                    "error": orjson.loads(response.content).get('message', response.text)
+                }
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Error configuring motion on {setup_name}: {e}")
-            results.append({
+            return {
                 "slot": slot_num,
                 "name": setup_name,
                 "status": "error",
                 "error": str(e)
-            })
+            }
+
+    online_slots = [(slot_num, slot) for slot_num, slot in SLOTS.items() if slot.is_online()]
+    results = []
+    if online_slots:
+        # Each setup can take up to a minute, so configure them all at once
+        with ThreadPoolExecutor(max_workers=min(16, len(online_slots))) as executor:
+            results = list(executor.map(lambda item: configure_slot(*item), online_slots))
 
     success_count = sum(1 for r in results if r['status'] == 'success')
     total_count = len(results)
@@ -634,7 +805,7 @@ def configure_motion():
 @app.route('/api/register_setup', methods=['POST'])
 def register_setup():
     """Manually register a specific setup for heartbeats"""
-    data = request.json
+    data = request.get_json(silent=True) or {}
     setup_id = data.get('setup_id')
     
     if not setup_id:
@@ -643,14 +814,15 @@ def register_setup():
     orchestrator_url = f"http://{request.host.split(':')[0]}:{port}"
     
     try:
-        response = requests.post(
+        response = http_session.post(
             f"http://{setup_id}/api/register_orchestrator",
-            json={"orchestrator_url": orchestrator_url},
+            data=orjson.dumps({"orchestrator_url": orchestrator_url}),
+            headers=JSON_HEADERS,
             timeout=5
         )
         response.raise_for_status()
-        return jsonify(response.json())
-    except requests.exceptions.RequestException as e:
+        return jsonify(orjson.loads(response.content))
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         return jsonify({"error": str(e)}), 500
 
 def main():
@@ -683,11 +855,13 @@ def main():
     logger.info("Press Ctrl+C to stop the server")
     
     try:
-        app.run(host='0.0.0.0', port=port, debug=False)
+        serve(app, host='0.0.0.0', port=port, threads=8, connection_limit=200, channel_timeout=30)
     except KeyboardInterrupt:
         logger.info("\nShutting down...")
     finally:
         zeroconf.close()
+        service_browser_listener.close()
+        http_session.close()
         logger.info("Service stopped")
 
 if __name__ == '__main__':